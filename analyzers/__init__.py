@@ -3,6 +3,15 @@ NFL Data Analyzers Package
 """
 
 from .alert_engine import NFLAlertEngine
-from .stats_calculator import calculate_expected_total, calculate_sharp_differential
+from .stats_calculator import (
+    calculate_expected_total,
+    calculate_expected_total_batch,
+    calculate_sharp_differential
+)
 
-__all__ = ['NFLAlertEngine', 'calculate_expected_total', 'calculate_sharp_differential']
\ No newline at end of file
+__all__ = [
+    'NFLAlertEngine',
+    'calculate_expected_total',
+    'calculate_expected_total_batch',
+    'calculate_sharp_differential'
+]
\ No newline at end of file
@@ -4,8 +4,53 @@ Analyzes collected data and generates actionable betting alerts
 """
 
 import json
-from typing import List, Dict, Any
+import os
+import re
+from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, asdict
 from datetime import datetime
+from itertools import chain
+from multiprocessing import Pool
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib json module
+    orjson = None
+
+# First number in a stat cell, e.g. "26.0" from "26.0 (#10)"
+_NUM_RE = re.compile(r'(\d+\.?\d*)')
+
+# Exact stat names TeamRankings uses for points per game
+_PPG_STATS = {'Points/Game', 'Points per Game', 'PPG'}
+
+# Game fields read by the alert checks; everything else is dropped on load
+_REQUIRED_FIELDS = ('id', 'away_team', 'home_team', 'odds', 'betting_percentages', 'matchup_stats')
+
+# Alert type configurations
+ALERT_TYPES = {
+    'sharp_money': {'emoji': '💎', 'priority': 'HIGH', 'color': '#10b981'},
+    'line_flip': {'emoji': '🔄', 'priority': 'HIGH', 'color': '#f59e0b'},
+    'line_movement': {'emoji': '📈', 'priority': 'MEDIUM', 'color': '#3b82f6'},
+    'value_over': {'emoji': '🔥', 'priority': 'HIGH', 'color': '#ef4444'},
+    'value_under': {'emoji': '❄️', 'priority': 'HIGH', 'color': '#06b6d4'},
+    'trap_game': {'emoji': '🪤', 'priority': 'MEDIUM', 'color': '#8b5cf6'},
+    'mismatch': {'emoji': '⚔️', 'priority': 'MEDIUM', 'color': '#ec4899'},
+    'public_fade': {'emoji': '🎯', 'priority': 'LOW', 'color': '#64748b'}
+}
+
+
+@dataclass(slots=True)
+class Alert:
+    """A single betting alert raised by one of the engine's checks"""
+    type: str
+    game: str
+    title: str
+    description: str
+    reasoning: str
+    data: Dict[str, Any]
+    priority: str
+    game_id: Optional[str]
+
 
 class NFLAlertEngine:
     def __init__(self, data_file: str):
@@ -15,49 +60,80 @@ class NFLAlertEngine:
         Args:
             data_file: Path to JSON file from collector
         """
-        with open(data_file, 'r') as f:
-            self.data = json.load(f)
+        with open(data_file, 'rb') as f:
+            raw = f.read()
+        self._load(orjson.loads(raw) if orjson else json.loads(raw))
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'NFLAlertEngine':
+        """
+        Initialize alert engine from data already in memory
+        
+        Skips writing and re-parsing the collector's JSON file. The data
+        is only read, so it can be saved on another thread meanwhile.
+        
+        Args:
+            data: Collected data in the collector's JSON layout (with 'games')
+        """
+        engine = cls.__new__(cls)
+        engine._load(data)
+        return engine
+    
+    def _load(self, data: Dict):
+        """Set up engine state from collected data"""
+        # Keep only the fields the checks use so unused data can be freed
+        # (in a new dict, leaving the caller's data untouched)
+        self.data = {**data, 'games': [
+            {k: game[k] for k in _REQUIRED_FIELDS if k in game}
+            for game in data.get('games', [])
+        ]}
         
         self.alerts = []
+
+        # Alerts are bucketed by priority as they are raised, so the final
+        # HIGH -> MEDIUM -> LOW ordering needs no sort
+        self._alerts_by_priority = {'HIGH': [], 'MEDIUM': [], 'LOW': []}
         
         # Alert type configurations
-        self.alert_types = {
-            'sharp_money': {'emoji': '💎', 'priority': 'HIGH', 'color': '#10b981'},
-            'line_flip': {'emoji': '🔄', 'priority': 'HIGH', 'color': '#f59e0b'},
-            'line_movement': {'emoji': '📈', 'priority': 'MEDIUM', 'color': '#3b82f6'},
-            'value_over': {'emoji': '🔥', 'priority': 'HIGH', 'color': '#ef4444'},
-            'value_under': {'emoji': '❄️', 'priority': 'HIGH', 'color': '#06b6d4'},
-            'trap_game': {'emoji': '🪤', 'priority': 'MEDIUM', 'color': '#8b5cf6'},
-            'mismatch': {'emoji': '⚔️', 'priority': 'MEDIUM', 'color': '#ec4899'},
-            'public_fade': {'emoji': '🎯', 'priority': 'LOW', 'color': '#64748b'}
-        }
+        self.alert_types = ALERT_TYPES
     
     def analyze_all_games(self):
         """Run all alert checks on all games"""
         print("🔍 Analyzing games for betting opportunities...\n")
         
         for game in self.data.get('games', []):
-            self._check_sharp_money(game)
-            self._check_line_flip(game)
-            self._check_line_movement(game)
-            self._check_total_value(game)
-            self._check_trap_game(game)
-            self._check_mismatch(game)
-            self._check_public_fade(game)
-        
-        # Sort alerts by priority
-        priority_order = {'HIGH': 0, 'MEDIUM': 1, 'LOW': 2}
-        self.alerts.sort(key=lambda x: priority_order.get(x['priority'], 3))
+            # Values shared by several checks are computed once per game
+            game_label = f"{game['away_team']} @ {game['home_team']}"
+            game_id = game.get('id')
+            odds = game.get('odds', {})
+            betting = game.get('betting_percentages', {})
+            bet_pct = self._parse_percentage(betting.get('spread_bet_pct', '0'))
+            money_pct = self._parse_percentage(betting.get('spread_money_pct', '0'))
+            stats = self._extract_scoring_stats(game.get('matchup_stats', {}))
+
+            self._check_sharp_money(game, game_label, game_id, bet_pct, money_pct)
+            self._check_line_flip(game, game_label, game_id, odds)
+            self._check_line_movement(game, game_label, game_id, odds)
+            self._check_total_value(game, game_label, game_id, odds, stats)
+            self._check_trap_game(game, game_label, game_id, bet_pct, money_pct)
+            self._check_mismatch(game, game_label, game_id, stats)
+            self._check_public_fade(game, game_label, game_id, bet_pct)
+        
+        # Concatenate priority buckets (HIGH first)
+        self.alerts = (
+            self._alerts_by_priority['HIGH'] +
+            self._alerts_by_priority['MEDIUM'] +
+            self._alerts_by_priority['LOW']
+        )
         
         return self.alerts
+
+    def _add_alert(self, alert: Alert):
+        """Record an alert in its priority bucket"""
+        self._alerts_by_priority[alert.priority].append(alert)
     
-    def _check_sharp_money(self, game: Dict):
+    def _check_sharp_money(self, game: Dict, game_label: str, game_id: Optional[str], bet_pct: float, money_pct: float):
         """Alert 1: Smart money differential by 25%+"""
-        betting = game.get('betting_percentages', {})
-        
-        bet_pct = self._parse_percentage(betting.get('spread_bet_pct', '0'))
-        money_pct = self._parse_percentage(betting.get('spread_money_pct', '0'))
-        
         if bet_pct == 0 or money_pct == 0:
             return
         
@@ -72,26 +148,25 @@ class NFLAlertEngine:
                 sharp_side = "Lower money % side (reverse line movement)"
                 reasoning = f"{money_pct}% of money on {bet_pct}% of bets = Public trap potential"
             
-            self.alerts.append({
-                'type': 'sharp_money',
-                'game': f"{game['away_team']} @ {game['home_team']}",
-                'title': f"💎 SHARP MONEY ALERT: {differential:.1f}% Differential",
-                'description': f"{sharp_side} - Professional bettors strongly on one side",
-                'reasoning': reasoning,
-                'data': {
+            self._add_alert(Alert(
+                type='sharp_money',
+                game=game_label,
+                title=f"💎 SHARP MONEY ALERT: {differential:.1f}% Differential",
+                description=f"{sharp_side} - Professional bettors strongly on one side",
+                reasoning=reasoning,
+                data={
                     'bet_pct': bet_pct,
                     'money_pct': money_pct,
                     'differential': differential
                 },
-                'priority': 'HIGH',
-                'game_id': game.get('id')
-            })
+                priority='HIGH',
+                game_id=game_id
+            ))
     
-    def _check_line_flip(self, game: Dict):
+    def _check_line_flip(self, game: Dict, game_label: str, game_id: Optional[str], odds: Dict):
         """Alert 2: Lines that flipped team favorite"""
         # This requires historical line data to properly detect flips
         # Check if the game has opening_line and current_line data
-        odds = game.get('odds', {})
         spreads = odds.get('spreads', {})
 
         # Look for opening_line in the data (if it exists)
@@ -118,26 +193,25 @@ class NFLAlertEngine:
 
         if opening_favorite != current_favorite and abs(opening_line) > 1 and abs(home_spread) > 1:
             flipped_team = home_team if current_favorite == "home" else away_team
-            self.alerts.append({
-                'type': 'line_flip',
-                'game': f"{game['away_team']} @ {game['home_team']}",
-                'title': f"🔄 LINE FLIPPED: {flipped_team} now favored",
-                'description': f"Line moved from {opening_line} to {home_spread} - Favorite switched teams",
-                'reasoning': "Line flips indicate significant sharp money movement. This is a strong signal.",
-                'data': {
+            self._add_alert(Alert(
+                type='line_flip',
+                game=game_label,
+                title=f"🔄 LINE FLIPPED: {flipped_team} now favored",
+                description=f"Line moved from {opening_line} to {home_spread} - Favorite switched teams",
+                reasoning="Line flips indicate significant sharp money movement. This is a strong signal.",
+                data={
                     'opening_line': opening_line,
                     'current_line': home_spread,
                     'flipped_to': flipped_team
                 },
-                'priority': 'HIGH',
-                'game_id': game.get('id')
-            })
+                priority='HIGH',
+                game_id=game_id
+            ))
     
-    def _check_line_movement(self, game: Dict):
+    def _check_line_movement(self, game: Dict, game_label: str, game_id: Optional[str], odds: Dict):
         """Alert 3: Lines that moved more than 4 points"""
         # This requires historical line tracking
         # For now, flag unusually large spreads as "moved from opener"
-        odds = game.get('odds', {})
         spreads = odds.get('spreads', {})
         
         for team, spread_data in spreads.items():
@@ -145,24 +219,22 @@ class NFLAlertEngine:
             
             # Large spreads (14+) suggest significant movement from opener
             if line >= 14:
-                self.alerts.append({
-                    'type': 'line_movement',
-                    'game': f"{game['away_team']} @ {game['home_team']}",
-                    'title': f"📈 LARGE SPREAD: {team} {spread_data.get('line')}",
-                    'description': f"Unusually large line suggests significant early movement",
-                    'reasoning': "Big spreads often indicate injury news or sharp action moved the line dramatically.",
-                    'data': {
+                self._add_alert(Alert(
+                    type='line_movement',
+                    game=game_label,
+                    title=f"📈 LARGE SPREAD: {team} {spread_data.get('line')}",
+                    description=f"Unusually large line suggests significant early movement",
+                    reasoning="Big spreads often indicate injury news or sharp action moved the line dramatically.",
+                    data={
                         'current_line': spread_data.get('line')
                     },
-                    'priority': 'MEDIUM',
-                    'game_id': game.get('id')
-                })
+                    priority='MEDIUM',
+                    game_id=game_id
+                ))
                 break
     
-    def _check_total_value(self, game: Dict):
+    def _check_total_value(self, game: Dict, game_label: str, game_id: Optional[str], odds: Dict, stats: Optional[Dict]):
         """Alerts 4 & 5: Over/Under value based on custom formula"""
-        matchup = game.get('matchup_stats', {})
-        odds = game.get('odds', {})
         totals = odds.get('totals', {})
         
         # Get the line
@@ -170,8 +242,6 @@ class NFLAlertEngine:
         if not over_line:
             return
         
-        # Extract stats from matchup data
-        stats = self._extract_scoring_stats(matchup)
         if not stats:
             return
         
@@ -187,69 +257,60 @@ class NFLAlertEngine:
         
         # Alert 4: Over is 20%+ less than expected (value on OVER)
         if percent_diff <= -20:
-            self.alerts.append({
-                'type': 'value_over',
-                'game': f"{game['away_team']} @ {game['home_team']}",
-                'title': f"🔥 VALUE OVER: Line at {over_line}, Expected {expected_total:.1f}",
-                'description': f"Over is {abs(percent_diff):.1f}% below expected total - STRONG OVER VALUE",
-                'reasoning': f"Formula: ({stats['away_offense_ppg']}+{stats['home_offense_ppg']})*.6 + ({stats['away_defense_ppg']}+{stats['home_defense_ppg']})*.4 = {expected_total:.1f}",
-                'data': {
+            self._add_alert(Alert(
+                type='value_over',
+                game=game_label,
+                title=f"🔥 VALUE OVER: Line at {over_line}, Expected {expected_total:.1f}",
+                description=f"Over is {abs(percent_diff):.1f}% below expected total - STRONG OVER VALUE",
+                reasoning=f"Formula: ({stats['away_offense_ppg']}+{stats['home_offense_ppg']})*.6 + ({stats['away_defense_ppg']}+{stats['home_defense_ppg']})*.4 = {expected_total:.1f}",
+                data={
                     'line': over_line,
                     'expected': expected_total,
                     'difference': difference,
                     'percent_diff': percent_diff
                 },
-                'priority': 'HIGH',
-                'game_id': game.get('id')
-            })
+                priority='HIGH',
+                game_id=game_id
+            ))
         
         # Alert 5: Under is 20%+ more than expected (value on UNDER)
         if percent_diff >= 20:
-            self.alerts.append({
-                'type': 'value_under',
-                'game': f"{game['away_team']} @ {game['home_team']}",
-                'title': f"❄️ VALUE UNDER: Line at {over_line}, Expected {expected_total:.1f}",
-                'description': f"Under is {percent_diff:.1f}% above expected total - STRONG UNDER VALUE",
-                'reasoning': f"Formula: ({stats['away_offense_ppg']}+{stats['home_offense_ppg']})*.6 + ({stats['away_defense_ppg']}+{stats['home_defense_ppg']})*.4 = {expected_total:.1f}",
-                'data': {
+            self._add_alert(Alert(
+                type='value_under',
+                game=game_label,
+                title=f"❄️ VALUE UNDER: Line at {over_line}, Expected {expected_total:.1f}",
+                description=f"Under is {percent_diff:.1f}% above expected total - STRONG UNDER VALUE",
+                reasoning=f"Formula: ({stats['away_offense_ppg']}+{stats['home_offense_ppg']})*.6 + ({stats['away_defense_ppg']}+{stats['home_defense_ppg']})*.4 = {expected_total:.1f}",
+                data={
                     'line': over_line,
                     'expected': expected_total,
                     'difference': difference,
                     'percent_diff': percent_diff
                 },
-                'priority': 'HIGH',
-                'game_id': game.get('id')
-            })
+                priority='HIGH',
+                game_id=game_id
+            ))
     
-    def _check_trap_game(self, game: Dict):
+    def _check_trap_game(self, game: Dict, game_label: str, game_id: Optional[str], bet_pct: float, money_pct: float):
         """Identify potential trap games"""
-        betting = game.get('betting_percentages', {})
-        odds = game.get('odds', {})
-        
-        bet_pct = self._parse_percentage(betting.get('spread_bet_pct', '0'))
-        money_pct = self._parse_percentage(betting.get('spread_money_pct', '0'))
-        
         # Public heavy on one side, sharp money on other
         if bet_pct >= 70 and money_pct <= 45:
-            self.alerts.append({
-                'type': 'trap_game',
-                'game': f"{game['away_team']} @ {game['home_team']}",
-                'title': f"🪤 TRAP GAME: Public vs Sharps",
-                'description': f"{bet_pct}% of bets but only {money_pct}% of money",
-                'reasoning': "Classic trap setup - public loading one side, sharps taking the other",
-                'data': {
+            self._add_alert(Alert(
+                type='trap_game',
+                game=game_label,
+                title=f"🪤 TRAP GAME: Public vs Sharps",
+                description=f"{bet_pct}% of bets but only {money_pct}% of money",
+                reasoning="Classic trap setup - public loading one side, sharps taking the other",
+                data={
                     'bet_pct': bet_pct,
                     'money_pct': money_pct
                 },
-                'priority': 'MEDIUM',
-                'game_id': game.get('id')
-            })
+                priority='MEDIUM',
+                game_id=game_id
+            ))
     
-    def _check_mismatch(self, game: Dict):
+    def _check_mismatch(self, game: Dict, game_label: str, game_id: Optional[str], stats: Optional[Dict]):
         """Identify offensive/defensive mismatches"""
-        matchup = game.get('matchup_stats', {})
-        stats = self._extract_scoring_stats(matchup)
-        
         if not stats:
             return
         
@@ -258,43 +319,39 @@ class NFLAlertEngine:
         home_advantage = stats['home_offense_ppg'] - stats['away_defense_ppg']
         
         if away_advantage >= 8:
-            self.alerts.append({
-                'type': 'mismatch',
-                'game': f"{game['away_team']} @ {game['home_team']}",
-                'title': f"⚔️ OFFENSIVE MISMATCH: {game['away_team']}",
-                'description': f"{game['away_team']} offense ({stats['away_offense_ppg']} ppg) vs {game['home_team']} defense ({stats['home_defense_ppg']} ppg allowed)",
-                'reasoning': f"{away_advantage:.1f} point advantage - Strong offensive matchup",
-                'data': {
+            self._add_alert(Alert(
+                type='mismatch',
+                game=game_label,
+                title=f"⚔️ OFFENSIVE MISMATCH: {game['away_team']}",
+                description=f"{game['away_team']} offense ({stats['away_offense_ppg']} ppg) vs {game['home_team']} defense ({stats['home_defense_ppg']} ppg allowed)",
+                reasoning=f"{away_advantage:.1f} point advantage - Strong offensive matchup",
+                data={
                     'advantage': away_advantage,
                     'offense_ppg': stats['away_offense_ppg'],
                     'defense_ppg': stats['home_defense_ppg']
                 },
-                'priority': 'MEDIUM',
-                'game_id': game.get('id')
-            })
+                priority='MEDIUM',
+                game_id=game_id
+            ))
         
         if home_advantage >= 8:
-            self.alerts.append({
-                'type': 'mismatch',
-                'game': f"{game['away_team']} @ {game['home_team']}",
-                'title': f"⚔️ OFFENSIVE MISMATCH: {game['home_team']}",
-                'description': f"{game['home_team']} offense ({stats['home_offense_ppg']} ppg) vs {game['away_team']} defense ({stats['away_defense_ppg']} ppg allowed)",
-                'reasoning': f"{home_advantage:.1f} point advantage - Strong offensive matchup",
-                'data': {
+            self._add_alert(Alert(
+                type='mismatch',
+                game=game_label,
+                title=f"⚔️ OFFENSIVE MISMATCH: {game['home_team']}",
+                description=f"{game['home_team']} offense ({stats['home_offense_ppg']} ppg) vs {game['away_team']} defense ({stats['away_defense_ppg']} ppg allowed)",
+                reasoning=f"{home_advantage:.1f} point advantage - Strong offensive matchup",
+                data={
                     'advantage': home_advantage,
                     'offense_ppg': stats['home_offense_ppg'],
                     'defense_ppg': stats['away_defense_ppg']
                 },
-                'priority': 'MEDIUM',
-                'game_id': game.get('id')
-            })
+                priority='MEDIUM',
+                game_id=game_id
+            ))
     
-    def _check_public_fade(self, game: Dict):
+    def _check_public_fade(self, game: Dict, game_label: str, game_id: Optional[str], bet_pct: float):
         """Identify opportunities to fade the public"""
-        betting = game.get('betting_percentages', {})
-
-        bet_pct = self._parse_percentage(betting.get('spread_bet_pct', '0'))
-
         # Skip if no betting data available
         if bet_pct == 0:
             return
@@ -303,22 +360,41 @@ class NFLAlertEngine:
             side = "favorite" if bet_pct >= 75 else "underdog"
             fade_side = "underdog" if bet_pct >= 75 else "favorite"
 
-            self.alerts.append({
-                'type': 'public_fade',
-                'game': f"{game['away_team']} @ {game['home_team']}",
-                'title': f"🎯 PUBLIC FADE: {bet_pct}% on {side}",
-                'description': f"Extreme public betting on {side} - Consider {fade_side}",
-                'reasoning': "Public tends to overvalue favorites and popular teams",
-                'data': {
+            self._add_alert(Alert(
+                type='public_fade',
+                game=game_label,
+                title=f"🎯 PUBLIC FADE: {bet_pct}% on {side}",
+                description=f"Extreme public betting on {side} - Consider {fade_side}",
+                reasoning="Public tends to overvalue favorites and popular teams",
+                data={
                     'bet_pct': bet_pct,
                     'fade_side': fade_side
                 },
-                'priority': 'LOW',
-                'game_id': game.get('id')
-            })
+                priority='LOW',
+                game_id=game_id
+            ))
     
-    def _extract_scoring_stats(self, matchup: Dict) -> Dict:
+    def _extract_scoring_stats(self, matchup: Dict) -> Optional[Dict]:
         """Extract PPG stats from matchup data"""
+        offense_defense = matchup.get('offense_vs_defense', {})
+
+        # Untitled TeamRankings tables: "Table 1" is away offense vs home
+        # defense, "Table 2" is home offense vs away defense (same layout
+        # json_to_csv reads)
+        away_off_row = self._find_ppg_row(offense_defense.get('Table 1', []))
+        home_off_row = self._find_ppg_row(offense_defense.get('Table 2', []))
+
+        if away_off_row or home_off_row:
+            stats = {
+                'home_offense_ppg': self._extract_number(home_off_row.get('away', '0')),
+                'away_offense_ppg': self._extract_number(away_off_row.get('away', '0')),
+                'home_defense_ppg': self._extract_number(away_off_row.get('home', '0')),
+                'away_defense_ppg': self._extract_number(home_off_row.get('home', '0'))
+            }
+            if any(stats.values()):
+                return stats
+
+        # Otherwise fall back to section-titled tables (e.g. "Offense")
         stats = {
             'home_offense_ppg': 0,
             'away_offense_ppg': 0,
@@ -326,24 +402,32 @@ class NFLAlertEngine:
             'away_defense_ppg': 0
         }
         
-        offense_defense = matchup.get('offense_vs_defense', {})
-        
         # Search through all tables for PPG data
         for table_name, table_data in offense_defense.items():
+            # Classify the table once rather than per row
+            tname = table_name.lower()
+            is_offense = 'offense' in tname
+            is_defense = 'defense' in tname
+
             for row in table_data:
                 stat = row.get('stat', '').lower()
-                
-                if 'points per game' in stat or 'ppg' in stat:
-                    # Extract numeric values
-                    away_val = self._extract_number(row.get('away', '0'))
-                    home_val = self._extract_number(row.get('home', '0'))
-                    
-                    if 'offense' in table_name.lower():
-                        stats['away_offense_ppg'] = away_val
-                        stats['home_offense_ppg'] = home_val
-                    elif 'defense' in table_name.lower() or 'allowed' in stat:
-                        stats['away_defense_ppg'] = away_val
-                        stats['home_defense_ppg'] = home_val
+                if 'ppg' not in stat and 'points per game' not in stat:
+                    continue
+
+                # Extract numeric values
+                away_val = self._extract_number(row.get('away', '0'))
+                home_val = self._extract_number(row.get('home', '0'))
+
+                if is_offense:
+                    stats['away_offense_ppg'] = away_val
+                    stats['home_offense_ppg'] = home_val
+                elif is_defense or 'allowed' in stat:
+                    stats['away_defense_ppg'] = away_val
+                    stats['home_defense_ppg'] = home_val
+
+                # Stop scanning once every slot is filled
+                if all(stats.values()):
+                    return stats
         
         # Return None if no valid stats found
         if all(v == 0 for v in stats.values()):
@@ -351,18 +435,25 @@ class NFLAlertEngine:
         
         return stats
     
+    def _find_ppg_row(self, table: List[Dict]) -> Dict:
+        """Return the points-per-game row of a stat table, or {} if absent"""
+        for row in table:
+            if row.get('stat') in _PPG_STATS:
+                return row
+        return {}
+    
     def _parse_percentage(self, pct_str: str) -> float:
         """Convert percentage string to float"""
+        s = str(pct_str or '').strip().rstrip('%').strip()
         try:
-            return float(pct_str.replace('%', '').strip())
-        except:
+            return float(s)
+        except ValueError:
             return 0
     
     def _extract_number(self, text: str) -> float:
         """Extract first number from text"""
-        import re
-        match = re.search(r'(\d+\.?\d*)', str(text))
-        return float(match.group(1)) if match else 0
+        match = _NUM_RE.search(str(text))
+        return float(match.group(1)) if match else 0.0
     
     def print_alerts(self):
         """Print all alerts to console"""
@@ -374,68 +465,119 @@ class NFLAlertEngine:
         print("="*80)
         
         for i, alert in enumerate(self.alerts, 1):
-            emoji = self.alert_types[alert['type']]['emoji']
-            print(f"\n{i}. {emoji} {alert['title']}")
-            print(f"   Game: {alert['game']}")
-            print(f"   Priority: {alert['priority']}")
-            print(f"   {alert['description']}")
-            print(f"   Why: {alert['reasoning']}")
+            # Titles already start with the alert type's emoji
+            print(f"\n{i}. {alert.title}")
+            print(f"   Game: {alert.game}")
+            print(f"   Priority: {alert.priority}")
+            print(f"   {alert.description}")
+            print(f"   Why: {alert.reasoning}")
             print("-"*80)
     
-    def export_alerts(self, filename: str = 'betting_alerts.json'):
-        """Export alerts to JSON file"""
+    def export_alerts(self, filename: str = 'betting_alerts.json', data_hash: Optional[str] = None):
+        """
+        Export alerts to JSON file
+        
+        Args:
+            filename: Output filename
+            data_hash: Fingerprint of the analyzed data, stored so a later
+                run with identical data can reuse these alerts
+        """
         output = {
             'generated_at': datetime.now().isoformat(),
             'total_alerts': len(self.alerts),
-            'alerts': self.alerts
+            'alerts': [asdict(alert) for alert in self.alerts]
         }
+        if data_hash:
+            output['data_hash'] = data_hash
         
-        with open(filename, 'w') as f:
-            json.dump(output, f, indent=2)
+        if orjson:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(output, f, indent=2)
         
         print(f"\n💾 Alerts exported to {filename}")
         return filename
 
 
+def _analyze_file(data_file: str) -> List[Alert]:
+    """Run all alert checks on one data file (multiprocessing worker)"""
+    return NFLAlertEngine(data_file).analyze_all_games()
+
+
+def analyze_files(data_files: List[str]) -> List[Alert]:
+    """
+    Analyze several weekly data files in parallel
+    
+    Each week is independent, so files are farmed out to a process pool
+    and the results merged back into HIGH -> MEDIUM -> LOW order.
+    
+    Args:
+        data_files: Paths to JSON files from collector
+    
+    Returns:
+        Combined list of alerts from all files
+    """
+    with Pool(min(len(data_files), os.cpu_count() or 1)) as pool:
+        results = pool.map(_analyze_file, data_files)
+    
+    buckets = {'HIGH': [], 'MEDIUM': [], 'LOW': []}
+    for alert in chain.from_iterable(results):
+        buckets[alert.priority].append(alert)
+    
+    return buckets['HIGH'] + buckets['MEDIUM'] + buckets['LOW']
+
+
 # =============================================================================
 # USAGE EXAMPLE
 # =============================================================================
 
 if __name__ == "__main__":
-    # Load the data file from collector
+    import sys
+    from glob import glob
+    
+    # Load the data file(s) from collector - pass paths or globs to
+    # analyze several weeks at once, e.g. "data/weekly/*.json"
     DATA_FILE = "nfl_week_7_data.json"
+    data_files = [path for arg in sys.argv[1:] for path in (sorted(glob(arg)) or [arg])] or [DATA_FILE]
     
     try:
-        # Initialize alert engine
-        engine = NFLAlertEngine(DATA_FILE)
-        
-        # Run all alert checks
-        alerts = engine.analyze_all_games()
-        
-        # Print results
-        engine.print_alerts()
-        
-        # Export to file
-        engine.export_alerts()
+        if len(data_files) == 1:
+            # Initialize alert engine
+            engine = NFLAlertEngine(data_files[0])
+            
+            # Run all alert checks
+            alerts = engine.analyze_all_games()
+            
+            # Print results
+            engine.print_alerts()
+            
+            # Export to file
+            engine.export_alerts()
+        else:
+            # Analyze each week in its own process
+            alerts = analyze_files(data_files)
         
         print("\n" + "="*80)
         print(f"📊 Alert Summary:")
+        print(f"   Files Analyzed: {len(data_files)}")
         print(f"   Total Alerts: {len(alerts)}")
         
         # Count by type
         by_type = {}
         for alert in alerts:
-            alert_type = alert['type']
+            alert_type = alert.type
             by_type[alert_type] = by_type.get(alert_type, 0) + 1
         
+        emoji_by_type = {t: v['emoji'] for t, v in ALERT_TYPES.items()}
         for alert_type, count in sorted(by_type.items(), key=lambda x: x[1], reverse=True):
-            emoji = engine.alert_types[alert_type]['emoji']
-            print(f"   {emoji} {alert_type}: {count}")
+            print(f"   {emoji_by_type[alert_type]} {alert_type}: {count}")
         
         print("="*80)
         
-    except FileNotFoundError:
-        print(f"❌ Error: Could not find {DATA_FILE}")
+    except FileNotFoundError as e:
+        print(f"❌ Error: Could not find {e.filename}")
         print("   Run the data collector first!")
     except Exception as e:
         print(f"❌ Error: {e}")
\ No newline at end of file
@@ -4,34 +4,60 @@ Convert NFL week data JSON to CSV format
 Extracts key matchup stats and odds data into a flat CSV structure
 """
 
+import csv
 import json
-import sys
 import re
-import pandas as pd
+import sys
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
-
-
-def parse_stat_value(value: str) -> Tuple[str, str]:
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib json module
+    orjson = None
+
+
+# Matches a stat value like "17.1 (#28)" as (value, rank); rank is optional
+_STAT_RE = re.compile(r'^\s*(?P<value>[\d.]+)\s*(?:\(#(?P<rank>\d+)\))?')
+
+# Exact CSV column order
+CSV_COLUMNS = [
+    'away_team',
+    'home_team',
+    'total_line',
+    'total_line_est',
+    'total_diff',
+    'away_spread_est',
+    'away_pts_est',
+    'home_pts_est',
+    'away_off_ppg',
+    'away_off_ppg_rank',
+    'home_def_ppg',
+    'home_def_ppg_rank',
+    'home_off_ppg',
+    'home_off_ppg_rank',
+    'away_def_ppg',
+    'away_def_ppg_rank',
+    'away_off_ypg',
+    'home_def_ypg',
+    'home_off_ypg',
+    'away_def_ypg',
+    'away_tds_per_game',
+    'home_tds_per_game',
+]
+
+
+def index_table(table: List[Dict]) -> Dict[str, Dict]:
     """
-    Parse a stat value like "17.1 (#28)" into value and rank
+    Index a stat table by stat name for O(1) lookups
 
     Args:
-        value: String like "17.1 (#28)"
+        table: List of stat dictionaries
 
     Returns:
-        Tuple of (numeric_value, rank) e.g., ("17.1", "28")
+        Dictionary mapping stat name (e.g., "Points/Game") to its row
     """
-    if not value:
-        return ('', '')
-
-    # Extract number before parenthesis
-    match = re.match(r'([\d.]+)\s*\(#(\d+)\)', value)
-    if match:
-        return (match.group(1), match.group(2))
-
-    # If no match, return the value as-is and empty rank
-    return (value.strip(), '')
+    return {row.get('stat'): row for row in table}
 
 
 def extract_table_data(table: List[Dict], stat_name: str, team: str = 'away') -> str:
@@ -45,6 +71,10 @@ def extract_table_data(table: List[Dict], stat_name: str, team: str = 'away') ->
 
     Returns:
         The value (rank) string, or empty string if not found
+
+    Note:
+        Scans the table on every call; use index_table() when reading
+        several stats from the same table.
     """
     for row in table:
         if row.get('stat') == stat_name:
@@ -52,140 +82,130 @@ def extract_table_data(table: List[Dict], stat_name: str, team: str = 'away') ->
     return ''
 
 
-def json_to_dataframe(json_file_path: str) -> pd.DataFrame:
+def _parse_ppg(value: str) -> Tuple[Optional[float], str]:
     """
-    Convert NFL week JSON data to pandas DataFrame
+    Parse a stat value like "17.1 (#28)" into numeric value and rank
+
+    Args:
+        value: String like "17.1 (#28)"
+
+    Returns:
+        Tuple of (value, rank) e.g., (17.1, "28"); value is None if unparseable
+    """
+    match = _STAT_RE.match(str(value))
+    if not match:
+        return (None, '')
+    return (_to_float(match.group('value')), match.group('rank') or '')
+
+
+def _to_float(value) -> Optional[float]:
+    """Convert value to float, or None if it is not numeric"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _weighted_points(offense_ppg: Optional[float], defense_ppg: Optional[float]) -> Optional[float]:
+    """Estimate a team's points from its offense and the opposing defense"""
+    if offense_ppg is None or defense_ppg is None:
+        return None
+    return round((offense_ppg * 0.55) + (defense_ppg * 0.45), 1)
+
+
+def json_to_rows(json_file_path: str) -> List[Dict]:
+    """
+    Convert NFL week JSON data to a list of CSV rows
 
     Args:
         json_file_path: Path to the JSON file
 
     Returns:
-        DataFrame with columns:
-        - home_team
-        - away_team
-        - total_line (odds.totals.Over.line)
-        - table1_* (matchup_stats.offense_vs_defense.Table 1 stats)
-        - table2_* (matchup_stats.offense_vs_defense.Table 2 stats)
+        List of row dictionaries keyed by CSV_COLUMNS, sorted by absolute
+        total_diff (largest discrepancies first). Missing numbers are None.
     """
     # Read JSON file
-    with open(json_file_path, 'r') as f:
-        data = json.load(f)
+    with open(json_file_path, 'rb') as f:
+        raw = f.read()
+    data = orjson.loads(raw) if orjson else json.loads(raw)
 
     # Extract data for each game
     rows = []
 
     for game in data.get('games', []):
         # Extract total line from odds
-        odds = game.get('odds', {})
-        totals = odds.get('totals', {})
-        over = totals.get('Over', {})
+        over = game.get('odds', {}).get('totals', {}).get('Over', {})
+        total_line = _to_float(over.get('line'))
+
+        # Extract Table 1 and Table 2 stats, indexed by stat name
+        offense_vs_defense = game.get('matchup_stats', {}).get('offense_vs_defense', {})
+        table1 = index_table(offense_vs_defense.get('Table 1', []))
+        table2 = index_table(offense_vs_defense.get('Table 2', []))
+
+        # Parse Points/Game values into value and rank
+        away_off_ppg, away_off_rank = _parse_ppg(table1.get('Points/Game', {}).get('away', ''))
+        home_def_ppg, home_def_rank = _parse_ppg(table1.get('Points/Game', {}).get('home', ''))
+        home_off_ppg, home_off_rank = _parse_ppg(table2.get('Points/Game', {}).get('away', ''))
+        away_def_ppg, away_def_rank = _parse_ppg(table2.get('Points/Game', {}).get('home', ''))
+
+        # Calculate estimated points, total line estimate and away spread estimate
+        away_pts_est = _weighted_points(away_off_ppg, home_def_ppg)
+        home_pts_est = _weighted_points(home_off_ppg, away_def_ppg)
+
+        total_line_est = away_spread_est = total_diff = None
+        if away_pts_est is not None and home_pts_est is not None:
+            total_line_est = round(away_pts_est + home_pts_est, 1)
+            away_spread_est = round(home_pts_est - away_pts_est, 1)
+            # Difference between estimated and actual total line
+            if total_line is not None:
+                total_diff = round(total_line_est - total_line, 1)
+
+        rows.append({
+            'away_team': game.get('away_team', ''),
+            'home_team': game.get('home_team', ''),
+            'total_line': total_line,
+            'total_line_est': total_line_est,
+            'total_diff': total_diff,
+            'away_spread_est': away_spread_est,
+            'away_pts_est': away_pts_est,
+            'home_pts_est': home_pts_est,
+            'away_off_ppg': away_off_ppg,
+            'away_off_ppg_rank': away_off_rank,
+            'home_def_ppg': home_def_ppg,
+            'home_def_ppg_rank': home_def_rank,
+            'home_off_ppg': home_off_ppg,
+            'home_off_ppg_rank': home_off_rank,
+            'away_def_ppg': away_def_ppg,
+            'away_def_ppg_rank': away_def_rank,
+            'away_off_ypg': table1.get('Yards/Game', {}).get('away', ''),
+            'home_def_ypg': table1.get('Yards/Game', {}).get('home', ''),
+            'home_off_ypg': table2.get('Yards/Game', {}).get('away', ''),
+            'away_def_ypg': table2.get('Yards/Game', {}).get('home', ''),
+            'away_tds_per_game': table2.get('TDs/Game', {}).get('away', ''),
+            'home_tds_per_game': table2.get('TDs/Game', {}).get('home', ''),
+        })
+
+    # Sort by absolute value of total_diff (largest discrepancies first);
+    # games without a diff go last
+    rows.sort(key=lambda row: (row['total_diff'] is None, -abs(row['total_diff'] or 0)))
+
+    return rows
+
+
+def json_to_dataframe(json_file_path: str) -> 'pd.DataFrame':
+    """
+    Convert NFL week JSON data to pandas DataFrame
 
-        # Extract matchup stats
-        matchup_stats = game.get('matchup_stats', {})
-        offense_vs_defense = matchup_stats.get('offense_vs_defense', {})
+    Args:
+        json_file_path: Path to the JSON file
 
-        # Extract Table 1 and Table 2 stats
-        table1 = offense_vs_defense.get('Table 1', [])
-        table2 = offense_vs_defense.get('Table 2', [])
+    Returns:
+        DataFrame with the rows from json_to_rows() and CSV_COLUMNS columns
+    """
+    # pandas is only needed by callers that want a DataFrame
+    import pandas as pd
 
-        # Build row with new column names
-        row = {
-            'away_team': game.get('away_team', ''),
-            'home_team': game.get('home_team', ''),
-            'total_line': over.get('line', ''),
-            'away_off_ppg': extract_table_data(table1, 'Points/Game', 'away'),
-            'home_def_ppg': extract_table_data(table1, 'Points/Game', 'home'),
-            'away_off_ypg': extract_table_data(table1, 'Yards/Game', 'away'),
-            'home_def_ypg': extract_table_data(table1, 'Yards/Game', 'home'),
-            'home_off_ppg': extract_table_data(table2, 'Points/Game', 'away'),
-            'away_def_ppg': extract_table_data(table2, 'Points/Game', 'home'),
-            'home_off_ypg': extract_table_data(table2, 'Yards/Game', 'away'),
-            'away_def_ypg': extract_table_data(table2, 'Yards/Game', 'home'),
-            'away_tds_per_game': extract_table_data(table2, 'TDs/Game', 'away'),
-            'home_tds_per_game': extract_table_data(table2, 'TDs/Game', 'home'),
-        }
-
-        rows.append(row)
-
-    # Create DataFrame
-    df = pd.DataFrame(rows)
-
-    # Parse Points/Game columns into value and rank
-    points_columns = [
-        'away_off_ppg',
-        'home_def_ppg',
-        'home_off_ppg',
-        'away_def_ppg'
-    ]
-
-    for col in points_columns:
-        if col in df.columns:
-            # Parse each value into (value, rank)
-            parsed = df[col].apply(parse_stat_value)
-            # Create new columns
-            df[col] = parsed.apply(lambda x: x[0])  # Numeric value
-            df[f'{col}_rank'] = parsed.apply(lambda x: x[1])  # Rank
-
-    # Convert PPG columns to numeric for calculations
-    for col in points_columns:
-        df[col] = pd.to_numeric(df[col], errors='coerce')
-
-    # Calculate estimated points
-    df['away_pts_est'] = (df['away_off_ppg'] * 0.55) + (df['home_def_ppg'] * 0.45)
-    df['home_pts_est'] = (df['home_off_ppg'] * 0.55) + (df['away_def_ppg'] * 0.45)
-
-    # Round to 1 decimal place
-    df['away_pts_est'] = df['away_pts_est'].round(1)
-    df['home_pts_est'] = df['home_pts_est'].round(1)
-
-    # Calculate total line estimate and away spread estimate
-    df['total_line_est'] = (df['away_pts_est'] + df['home_pts_est']).round(1)
-    df['away_spread_est'] = (df['home_pts_est'] - df['away_pts_est']).round(1)
-
-    # Convert total_line to numeric for calculation
-    df['total_line'] = pd.to_numeric(df['total_line'], errors='coerce')
-
-    # Calculate difference between estimated and actual total line
-    df['total_diff'] = (df['total_line_est'] - df['total_line']).round(1)
-
-    # Sort by absolute value of total_diff (largest discrepancies first)
-    df['abs_total_diff'] = df['total_diff'].abs()
-    df = df.sort_values('abs_total_diff', ascending=False)
-    df = df.drop('abs_total_diff', axis=1)  # Remove temporary sorting column
-
-    # Define exact column order
-    new_order = [
-        'away_team',
-        'home_team',
-        'total_line',
-        'total_line_est',
-        'total_diff',
-        'away_spread_est',
-        'away_pts_est',
-        'home_pts_est',
-        'away_off_ppg',
-        'away_off_ppg_rank',
-        'home_def_ppg',
-        'home_def_ppg_rank',
-        'home_off_ppg',
-        'home_off_ppg_rank',
-        'away_def_ppg',
-        'away_def_ppg_rank',
-        'away_off_ypg',
-        'home_def_ypg',
-        'home_off_ypg',
-        'away_def_ypg',
-        'away_tds_per_game',
-        'home_tds_per_game',
-    ]
-
-    # Filter to only include columns that exist in the dataframe
-    new_order = [col for col in new_order if col in df.columns]
-
-    # Reorder DataFrame
-    df = df[new_order]
-
-    return df
+    return pd.DataFrame(json_to_rows(json_file_path), columns=CSV_COLUMNS)
 
 
 def main():
@@ -204,8 +224,8 @@ def main():
 
     print(f"Reading JSON file: {json_file_path}")
 
-    # Convert to DataFrame
-    df = json_to_dataframe(json_file_path)
+    # Convert to CSV rows
+    rows = json_to_rows(json_file_path)
 
     # Generate output filename
     input_file = Path(json_file_path)
@@ -220,15 +240,18 @@ def main():
 
     # Save to CSV
     try:
-        df.to_csv(output_file, index=False)
-        print(f"✅ Converted {len(df)} games to CSV")
+        with open(output_file, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"✅ Converted {len(rows)} games to CSV")
         print(f"📊 Output saved to: {output_file}")
     except Exception as e:
         print(f"❌ Error saving CSV: {e}")
         raise
 
-    print(f"\nDataFrame shape: {df.shape}")
-    print(f"Columns: {list(df.columns)}")
+    print(f"\nRows: {len(rows)}, Columns: {len(CSV_COLUMNS)}")
+    print(f"Columns: {CSV_COLUMNS}")
 
 
 if __name__ == "__main__":
@@ -5,10 +5,25 @@ Uses historical odds data to identify reverse line movement
 """
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib json module
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # Optional: snapshots are stored uncompressed
+    zstandard = None
+
+# Snapshot file name suffixes (.json.zst when zstandard is installed)
+_SNAPSHOT_SUFFIXES = ('.json', '.json.zst') if zstandard else ('.json',)
+
 
 class LineMovementTracker:
     """
@@ -24,6 +39,10 @@ class LineMovementTracker:
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
+        # Decoded snapshot files keyed by path, as (mtime_ns, data), so a
+        # batch of reports decodes each file once
+        self._snapshot_cache: Dict[Path, Tuple[int, Dict]] = {}
+
     def save_snapshot(self, games: List[Dict], timestamp: Optional[str] = None) -> str:
         """
         Save current odds snapshot for later comparison
@@ -43,12 +62,20 @@ class LineMovementTracker:
             'games': games
         }
 
-        # Save with timestamp in filename
+        # Save with timestamp in filename; compressed if zstandard is available
         filename = f"snapshot_{timestamp.replace(':', '-')}.json"
+        if zstandard:
+            filename += '.zst'
         filepath = self.data_dir / filename
 
-        with open(filepath, 'w') as f:
-            json.dump(snapshot, f, indent=2)
+        self._write_json(filepath, snapshot)
+
+        # Record where each game lives so get_snapshots can skip other files
+        index = self._load_index()
+        for entries in index.values():
+            entries[:] = [entry for entry in entries if entry[0] != filename]
+        self._index_games(index, filename, games)
+        self._write_json(self.data_dir / 'index.json', index)
 
         print(f"📸 Saved odds snapshot: {filepath}")
         return str(filepath)
@@ -63,22 +90,108 @@ class LineMovementTracker:
         Returns:
             List of snapshots ordered by timestamp
         """
-        snapshots = []
-
-        for snapshot_file in sorted(self.data_dir.glob('snapshot_*.json')):
-            with open(snapshot_file) as f:
-                data = json.load(f)
-
-            # Find this game in the snapshot
-            for game in data.get('games', []):
-                if game.get('id') == game_id:
-                    snapshots.append({
-                        'timestamp': data['timestamp'],
-                        'game': game
-                    })
-                    break
+        # Only open the snapshot files that contain this game; reads overlap
+        # in a thread pool and map() keeps them in timestamp order
+        entries = sorted(self._load_index().get(game_id, []))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            snapshots = executor.map(self._load_snapshot_game, entries)
+
+        return [snapshot for snapshot in snapshots if snapshot is not None]
+
+    def _load_snapshot_game(self, entry: List) -> Optional[Dict]:
+        """
+        Load one game from a snapshot file
+
+        Args:
+            entry: [filename, position in games] pair from the index
+
+        Returns:
+            Dictionary with timestamp and game, or None if the file is gone
+        """
+        filename, position = entry
+        try:
+            data = self._read_snapshot(self.data_dir / filename)
+        except FileNotFoundError:
+            return None
 
-        return snapshots
+        return {
+            'timestamp': data['timestamp'],
+            'game': data['games'][position]
+        }
+
+    def _read_snapshot(self, snapshot_file: Path) -> Dict:
+        """
+        Decode a snapshot file, reusing the cached copy while its mtime is unchanged
+
+        Args:
+            snapshot_file: Path to a snapshot_*.json(.zst) file
+
+        Returns:
+            Decoded snapshot (shared with the cache - do not modify)
+        """
+        mtime = snapshot_file.stat().st_mtime_ns
+        cached = self._snapshot_cache.get(snapshot_file)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        data = self._read_json(snapshot_file)
+        self._snapshot_cache[snapshot_file] = (mtime, data)
+        return data
+
+    def _load_index(self) -> Dict[str, List[List]]:
+        """
+        Load the per-game snapshot index, building it on first use
+
+        Returns:
+            Dictionary mapping game ID to [filename, position in games] pairs
+        """
+        index_path = self.data_dir / 'index.json'
+        if index_path.exists():
+            return self._read_json(index_path)
+
+        # No index yet (e.g. snapshots saved by an older version) - scan once
+        index = {}
+        # scandir's cached directory entries avoid a stat/Path per file
+        with os.scandir(self.data_dir) as entries:
+            filenames = sorted(
+                entry.name for entry in entries
+                if entry.name.startswith('snapshot_') and entry.name.endswith(_SNAPSHOT_SUFFIXES)
+                and entry.is_file(follow_symlinks=False)
+            )
+
+        for filename in filenames:
+            data = self._read_json(self.data_dir / filename)
+            self._index_games(index, filename, data.get('games', []))
+
+        self._write_json(index_path, index)
+        return index
+
+    @staticmethod
+    def _index_games(index: Dict[str, List[List]], filename: str, games: List[Dict]):
+        """Add the first occurrence of each game in a snapshot to the index"""
+        seen = set()
+        for position, game in enumerate(games):
+            game_id = game.get('id')
+            if game_id is not None and game_id not in seen:
+                seen.add(game_id)
+                index.setdefault(game_id, []).append([filename, position])
+
+    @staticmethod
+    def _read_json(filepath: Path):
+        """Read a whole JSON file (zstd-compressed if .zst) into memory and decode it"""
+        raw = filepath.read_bytes()
+        if filepath.suffix == '.zst':
+            raw = zstandard.ZstdDecompressor().decompress(raw)
+        return orjson.loads(raw) if orjson else json.loads(raw)
+
+    @staticmethod
+    def _write_json(filepath: Path, data):
+        """Write compact JSON (no indent) - these files are read by code, not people"""
+        raw = orjson.dumps(data) if orjson else json.dumps(data, separators=(',', ':')).encode()
+        if filepath.suffix == '.zst':
+            raw = zstandard.ZstdCompressor(level=3).compress(raw)
+        filepath.write_bytes(raw)
 
     def detect_reverse_line_movement(
         self,
@@ -135,62 +248,89 @@ class LineMovementTracker:
         if len(snapshots) < 2:
             return None
 
-        for i in range(len(snapshots) - 1):
-            prev_snapshot = snapshots[i]
-            curr_snapshot = snapshots[i + 1]
+        # Get spreads from multiple books; each snapshot is extracted once
+        # and carried forward as the previous one for the next pair
+        prev_spreads = self._extract_spreads(snapshots[0]['game'])
 
-            # Get spreads from multiple books
-            prev_spreads = self._extract_spreads(prev_snapshot['game'])
+        for curr_snapshot in snapshots[1:]:
             curr_spreads = self._extract_spreads(curr_snapshot['game'])
 
-            # Count books that moved significantly
-            significant_moves = 0
-            total_movement = 0
-
-            for book in prev_spreads:
-                if book in curr_spreads:
-                    movement = abs(curr_spreads[book] - prev_spreads[book])
-                    if movement >= 1.5:  # 1.5+ point move
-                        significant_moves += 1
-                        total_movement += movement
+            # Movement of every book quoted in both snapshots, keeping the
+            # 1.5+ point moves
+            movements = [abs(curr_spreads[book] - prev_spreads[book]) for book in prev_spreads if book in curr_spreads]
+            significant_moves = [movement for movement in movements if movement >= 1.5]
 
             # Steam move if 3+ books moved 1.5+ points
-            if significant_moves >= 3:
+            if len(significant_moves) >= 3:
+                # Direction of the average line across books, not of
+                # whichever book happens to be listed first
+                curr_mean = sum(curr_spreads.values()) / len(curr_spreads)
+                prev_mean = sum(prev_spreads.values()) / len(prev_spreads)
+
                 return {
                     'timestamp': curr_snapshot['timestamp'],
-                    'books_moved': significant_moves,
-                    'avg_movement': total_movement / significant_moves,
-                    'direction': 'up' if curr_spreads[list(curr_spreads.keys())[0]] > prev_spreads[list(prev_spreads.keys())[0]] else 'down'
+                    'books_moved': len(significant_moves),
+                    'avg_movement': sum(significant_moves) / len(significant_moves),
+                    'direction': 'up' if curr_mean > prev_mean else 'down'
                 }
 
+            prev_spreads = curr_spreads
+
         return None
 
-    def _extract_spreads(self, game: Dict) -> Dict[str, float]:
+    def _extract_all_lines(self, game: Dict) -> Dict[str, List[Tuple[str, Optional[float]]]]:
         """
-        Extract spread lines from all bookmakers
+        Extract spread and total lines from all bookmakers in a single pass
 
         Args:
             game: Game data from API
 
         Returns:
-            Dictionary mapping bookmaker name to spread line
+            Dictionary with:
+            - spreads: (bookmaker name, home team spread) pairs
+            - totals: (bookmaker name, Over line) pairs
         """
-        spreads = {}
+        home_team = game.get('home_team')
+        spreads = []
+        totals = []
 
         for bookmaker in game.get('bookmakers', []):
             book_name = bookmaker.get('key', '')
 
             for market in bookmaker.get('markets', []):
-                if market.get('key') == 'spreads':
-                    outcomes = market.get('outcomes', [])
-                    if len(outcomes) >= 2:
-                        # Use home team spread as reference
-                        for outcome in outcomes:
-                            if outcome.get('name') == game.get('home_team'):
-                                spreads[book_name] = outcome.get('point', 0)
-                                break
+                market_key = market.get('key')
+                outcomes = market.get('outcomes', [])
+
+                if market_key == 'spreads' and len(outcomes) >= 2:
+                    # Use home team spread as reference
+                    for outcome in outcomes:
+                        if outcome.get('name') == home_team:
+                            spreads.append((book_name, outcome.get('point')))
+                            break
+
+                elif market_key == 'totals' and outcomes:
+                    # Over line is the total
+                    for outcome in outcomes:
+                        if outcome.get('name') == 'Over':
+                            totals.append((book_name, outcome.get('point')))
+                            break
+
+        return {'spreads': spreads, 'totals': totals}
 
-        return spreads
+    def _extract_spreads(self, game: Dict) -> Dict[str, float]:
+        """
+        Extract spread lines from all bookmakers
+
+        Args:
+            game: Game data from API
+
+        Returns:
+            Dictionary mapping bookmaker name to spread line
+        """
+        return {
+            book_name: line if line is not None else 0
+            for book_name, line in self._extract_all_lines(game)['spreads']
+        }
 
     def calculate_consensus_line(self, game: Dict, market_type: str = 'spreads') -> Optional[float]:
         """
@@ -203,36 +343,54 @@ class LineMovementTracker:
         Returns:
             Average line across all books, or None if not available
         """
-        lines = []
+        return self._consensus_from_lines(self._extract_all_lines(game), market_type)
 
-        for bookmaker in game.get('bookmakers', []):
-            for market in bookmaker.get('markets', []):
-                if market.get('key') == market_type:
-                    outcomes = market.get('outcomes', [])
-
-                    if market_type == 'spreads' and len(outcomes) >= 2:
-                        # Get home team spread
-                        for outcome in outcomes:
-                            if outcome.get('name') == game.get('home_team'):
-                                line = outcome.get('point')
-                                if line is not None:
-                                    lines.append(line)
-                                break
-
-                    elif market_type == 'totals' and len(outcomes) >= 1:
-                        # Get Over line (total)
-                        for outcome in outcomes:
-                            if outcome.get('name') == 'Over':
-                                line = outcome.get('point')
-                                if line is not None:
-                                    lines.append(line)
-                                break
+    @staticmethod
+    def _consensus_from_lines(all_lines: Dict, market_type: str) -> Optional[float]:
+        """Average the non-missing lines of one market from _extract_all_lines()"""
+        lines = [line for _, line in all_lines.get(market_type, []) if line is not None]
 
         if not lines:
             return None
 
         return sum(lines) / len(lines)
 
+    def build_snapshot_frame(self, game_id: str) -> 'pd.DataFrame':
+        """
+        Flatten a game's snapshot history into one row per (snapshot, book)
+
+        Args:
+            game_id: Game ID to load snapshots for
+
+        Returns:
+            DataFrame with game_id, timestamp, book, spread and total columns;
+            spread/total are None where a book did not quote that market.
+            e.g. df.pivot(index='timestamp', columns='book', values='spread')
+        """
+        # pandas is only needed by callers that want a DataFrame
+        import pandas as pd
+
+        rows = []
+        for snapshot in self.get_snapshots(game_id):
+            all_lines = self._extract_all_lines(snapshot['game'])
+
+            # Merge each book's spread and total into a single row
+            by_book = {}
+            for market_type, column in (('spreads', 'spread'), ('totals', 'total')):
+                for book_name, line in all_lines[market_type]:
+                    row = by_book.setdefault(book_name, {
+                        'game_id': game_id,
+                        'timestamp': snapshot['timestamp'],
+                        'book': book_name,
+                        'spread': None,
+                        'total': None
+                    })
+                    row[column] = line
+
+            rows.extend(by_book.values())
+
+        return pd.DataFrame(rows, columns=['game_id', 'timestamp', 'book', 'spread', 'total'])
+
     def get_line_movement_report(self, game_id: str) -> Dict:
         """
         Generate comprehensive line movement report for a game
@@ -257,11 +415,15 @@ class LineMovementTracker:
         opening_game = snapshots[0]['game']
         current_game = snapshots[-1]['game']
 
-        opening_spread = self.calculate_consensus_line(opening_game, 'spreads')
-        current_spread = self.calculate_consensus_line(current_game, 'spreads')
+        # Walk each game's bookmakers once for both spreads and totals
+        opening_lines = self._extract_all_lines(opening_game)
+        current_lines = self._extract_all_lines(current_game)
+
+        opening_spread = self._consensus_from_lines(opening_lines, 'spreads')
+        current_spread = self._consensus_from_lines(current_lines, 'spreads')
 
-        opening_total = self.calculate_consensus_line(opening_game, 'totals')
-        current_total = self.calculate_consensus_line(current_game, 'totals')
+        opening_total = self._consensus_from_lines(opening_lines, 'totals')
+        current_total = self._consensus_from_lines(current_lines, 'totals')
 
         # Detect steam moves
         steam = self.detect_steam_move(snapshots)
@@ -5,6 +5,16 @@ Statistics calculation functions for betting analysis
 from typing import Dict, Optional
 
 
+class _KeepNumeric(dict):
+    """str.translate table that keeps digits and '.' and deletes everything else"""
+
+    def __missing__(self, key):
+        return None
+
+
+_NUMERIC_CHARS = _KeepNumeric((ord(c), c) for c in '0123456789.')
+
+
 def calculate_expected_total(
     home_offense_ppg: float,
     away_offense_ppg: float,
@@ -31,6 +41,26 @@ def calculate_expected_total(
     return offensive_component + defensive_component
 
 
+def calculate_expected_total_batch(home_offense_ppg, away_offense_ppg, home_defense_ppg, away_defense_ppg):
+    """
+    Calculate expected totals for many games at once
+    
+    Same formula as calculate_expected_total, written as a single fused
+    expression so NumPy arrays or pandas Series are evaluated element-wise
+    in one pass (e.g. a whole slate or season backtest).
+    
+    Args:
+        home_offense_ppg: Array of home offensive points per game
+        away_offense_ppg: Array of away offensive points per game
+        home_defense_ppg: Array of home defensive points allowed per game
+        away_defense_ppg: Array of away defensive points allowed per game
+    
+    Returns:
+        Array of expected total scores
+    """
+    return (home_offense_ppg + away_offense_ppg) * 0.6 + (home_defense_ppg + away_defense_ppg) * 0.4
+
+
 def calculate_sharp_differential(bet_percentage: float, money_percentage: float) -> float:
     """
     Calculate the differential between bet % and money %
@@ -81,6 +111,42 @@ def is_value_under(line: float, expected_total: float, threshold: float = 0.20)
     return percent_diff >= threshold
 
 
+def is_value_over_batch(lines, expected_totals, threshold: float = 0.20):
+    """
+    Check many lines for value on the OVER at once
+    
+    Same test as is_value_over, as one fused expression so NumPy arrays
+    or pandas Series are compared element-wise in one pass.
+    
+    Args:
+        lines: Array of current total lines
+        expected_totals: Array of calculated expected totals
+        threshold: Percentage threshold (default 20%)
+    
+    Returns:
+        Boolean array, True where the line is 20%+ below expected
+    """
+    return (lines - expected_totals) / expected_totals <= -threshold
+
+
+def is_value_under_batch(lines, expected_totals, threshold: float = 0.20):
+    """
+    Check many lines for value on the UNDER at once
+    
+    Same test as is_value_under, as one fused expression so NumPy arrays
+    or pandas Series are compared element-wise in one pass.
+    
+    Args:
+        lines: Array of current total lines
+        expected_totals: Array of calculated expected totals
+        threshold: Percentage threshold (default 20%)
+    
+    Returns:
+        Boolean array, True where the line is 20%+ above expected
+    """
+    return (lines - expected_totals) / expected_totals >= threshold
+
+
 def calculate_offensive_advantage(offense_ppg: float, opponent_defense_ppg: float) -> float:
     """
     Calculate offensive mismatch advantage
@@ -105,13 +171,11 @@ def extract_percentage(text: str) -> float:
     Returns:
         Percentage as float
     """
-    import re
-    
     if not text:
         return 0.0
     
     # Remove % symbol and any other non-numeric characters except decimal point
-    cleaned = re.sub(r'[^\d.]', '', str(text))
+    cleaned = str(text).translate(_NUMERIC_CHARS)
     
     try:
         return float(cleaned)
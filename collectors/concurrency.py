@@ -0,0 +1,115 @@
+"""
+Adaptive concurrency and rate limits for parallel API and scrape requests
+"""
+
+import threading
+import time
+from typing import Optional
+
+
+class AIMDController:
+    """
+    Additive-increase / multiplicative-decrease concurrency limit
+
+    Like TCP congestion control: every fast, successful response raises
+    the limit by alpha, while a slow response, a rate limit (429) or a
+    gateway error cuts it by the factor beta. Callers hold a slot between
+    acquire() and release(), so a fixed-size thread pool only runs as many
+    requests at once as the server is currently handling well.
+    """
+
+    # Status codes that mean the server wants fewer concurrent requests
+    BACKOFF_STATUSES = (429, 502, 503, 504)
+
+    def __init__(self, c_min: int = 1, c_max: int = 8, alpha: float = 0.5, beta: float = 0.5,
+                 target_latency: float = 2.0, initial: Optional[float] = None):
+        """
+        Initialize the controller
+
+        Args:
+            c_min: Lowest concurrency the limit can drop to
+            c_max: Highest concurrency the limit can grow to
+            alpha: Amount added to the limit after a good response
+            beta: Factor the limit is multiplied by after a bad response
+            target_latency: Seconds above which a response counts as slow
+            initial: Starting limit (default: c_min)
+        """
+        self.c_min = c_min
+        self.c_max = c_max
+        self.alpha = alpha
+        self.beta = beta
+        self.target_latency = target_latency
+
+        self._limit = float(initial if initial is not None else c_min)
+        self._active = 0
+        self._cond = threading.Condition()
+
+    @property
+    def concurrency(self) -> int:
+        """Number of requests currently allowed at once"""
+        return max(self.c_min, int(self._limit))
+
+    def acquire(self):
+        """Block until a request slot is free, then take it"""
+        with self._cond:
+            while self._active >= self.concurrency:
+                self._cond.wait()
+            self._active += 1
+
+    def release(self, latency: Optional[float] = None, status: Optional[int] = None):
+        """
+        Free a request slot and adjust the limit from its outcome
+
+        Args:
+            latency: Seconds the request took (None if it never completed)
+            status: HTTP status code (None on a network error)
+        """
+        with self._cond:
+            self._active -= 1
+
+            if status is None or status in self.BACKOFF_STATUSES or latency is None or latency > self.target_latency:
+                self._limit = max(self.c_min, self._limit * self.beta)
+            else:
+                self._limit = min(self.c_max, self._limit + self.alpha)
+
+            self._cond.notify_all()
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter
+
+    Tokens refill continuously at `rate` per second, up to `capacity`, and
+    each acquire() takes one. Unlike a fixed sleep between requests, time
+    already spent on a slow request counts toward the refill, so callers
+    only wait for the shortfall.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1):
+        """
+        Initialize the bucket (starts full)
+
+        Args:
+            rate: Tokens added per second (sustained requests per second)
+            capacity: Most tokens that can build up (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take a token, sleeping until one is available"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            if self._tokens < 1:
+                time.sleep((1 - self._tokens) / self.rate)
+                self._tokens = 1.0
+                self._updated = time.monotonic()
+
+            self._tokens -= 1
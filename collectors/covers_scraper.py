@@ -4,19 +4,33 @@ Covers.com scraper - Free public betting percentages
 No API key required - scrapes publicly available data
 """
 
+import requests
+from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from typing import Dict, List, Optional
-import time
 
 
 class CoversScraper:
     """Scraper for Covers.com NFL betting percentages"""
 
     BASE_URL = "https://www.covers.com/sport/football/nfl/matchups"
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+    # Collects the rendered text of a matchup card's team and percentage
+    # elements (same as WebElement.text) in a single call
+    _CARD_SCRIPT = """
+        const card = arguments[0];
+        const texts = cls => Array.from(card.getElementsByClassName(cls), el => el.innerText);
+        return {
+            teams: texts('covers-CoversConsensus-team'),
+            spread_pct: texts('covers-CoversConsensus-percentage'),
+            total_pct: texts('covers-CoversConsensus-total')
+        };
+    """
 
     def __init__(self, headless: bool = True):
         """
@@ -25,13 +39,24 @@ class CoversScraper:
         Args:
             headless: Run browser in headless mode
         """
+        self.headless = headless
+
+        # The browser is only started if the plain HTTP fetch finds no data
+        self.driver = None
+        self.wait = None
+
+    def _start_driver(self):
+        """Launch Chrome for pages that need JavaScript rendering"""
+        if self.driver:
+            return
+
         chrome_options = Options()
-        if headless:
+        if self.headless:
             chrome_options.add_argument('--headless=new')
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+        chrome_options.add_argument(f'user-agent={self.USER_AGENT}')
 
         self.driver = webdriver.Chrome(options=chrome_options)
         self.wait = WebDriverWait(self.driver, 15)
@@ -49,18 +74,23 @@ class CoversScraper:
             - spread_money_pct: Percentage of money on favorite (if available)
             - total_money_pct: Percentage of money on Over (if available)
         """
+        # Matchup cards are usually in the server-rendered HTML, which is far
+        # cheaper to fetch and parse than driving a browser
+        games = self._fetch_static()
+        if games:
+            return games
+
         try:
-            print(f"Loading Covers.com NFL matchups...")
+            print(f"Loading Covers.com NFL matchups in browser...")
+            self._start_driver()
             self.driver.get(self.BASE_URL)
 
-            # Wait for page to load
-            time.sleep(3)
-
             # Look for betting percentages section
             # Note: Covers.com structure may change - this is a starting point
             games = []
 
-            # Find all matchup cards
+            # Find all matchup cards - the explicit wait returns as soon as
+            # they are present, so no fixed sleep is needed after loading
             try:
                 matchup_cards = self.wait.until(
                     EC.presence_of_all_elements_located((By.CLASS_NAME, "covers-CoversConsensus"))
@@ -103,6 +133,48 @@ class CoversScraper:
             print(f"Error scraping Covers.com: {e}")
             return []
 
+    def _fetch_static(self) -> List[Dict]:
+        """
+        Fetch the matchups page over plain HTTP and parse the matchup cards
+
+        Returns:
+            List of games with betting percentage data, or empty list if the
+            page could not be fetched or has no server-rendered cards
+        """
+        try:
+            print(f"Fetching Covers.com NFL matchups...")
+            response = requests.get(self.BASE_URL, headers={'User-Agent': self.USER_AGENT}, timeout=15)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"Could not fetch matchups page: {e}")
+            return []
+
+        soup = BeautifulSoup(response.text, 'lxml')
+        matchup_cards = soup.select('.covers-CoversConsensus')
+
+        if not matchup_cards:
+            print("No matchup cards in page HTML")
+            return []
+
+        print(f"Found {len(matchup_cards)} games with betting data")
+
+        games = []
+        for card in matchup_cards:
+            game_data = self._parse_card_fields(
+                self._select_texts(card, 'covers-CoversConsensus-team'),
+                self._select_texts(card, 'covers-CoversConsensus-percentage'),
+                self._select_texts(card, 'covers-CoversConsensus-total')
+            )
+            if game_data:
+                games.append(game_data)
+
+        return games
+
+    @staticmethod
+    def _select_texts(card, class_name: str) -> List[str]:
+        """Text of every element with the given class inside a parsed card"""
+        return [el.get_text(' ', strip=True) for el in card.select(f'.{class_name}')]
+
     def _parse_matchup_card(self, card) -> Optional[Dict]:
         """
         Parse a matchup card element to extract betting percentages
@@ -113,39 +185,53 @@ class CoversScraper:
         Returns:
             Dictionary with team names and betting percentages
         """
-        game_data = {}
-
         try:
-            # Extract team names
-            teams = card.find_elements(By.CLASS_NAME, "covers-CoversConsensus-team")
-            if len(teams) >= 2:
-                game_data['away_team'] = teams[0].text.strip()
-                game_data['home_team'] = teams[1].text.strip()
-
-            # Extract spread betting percentages
-            spread_pct = card.find_elements(By.CLASS_NAME, "covers-CoversConsensus-percentage")
-            if len(spread_pct) >= 1:
-                pct_text = spread_pct[0].text.strip().replace('%', '')
-                try:
-                    game_data['spread_bet_pct'] = float(pct_text)
-                except ValueError:
-                    pass
-
-            # Extract total (over/under) percentages
-            total_pct = card.find_elements(By.CLASS_NAME, "covers-CoversConsensus-total")
-            if len(total_pct) >= 1:
-                pct_text = total_pct[0].text.strip().replace('%', '')
-                try:
-                    game_data['total_bet_pct'] = float(pct_text)
-                except ValueError:
-                    pass
+            # Read all fields in one WebDriver round-trip instead of one per selector
+            fields = self.driver.execute_script(self._CARD_SCRIPT, card)
 
-            return game_data if len(game_data) > 2 else None
+            return self._parse_card_fields(fields['teams'], fields['spread_pct'], fields['total_pct'])
 
         except Exception as e:
             print(f"Error parsing card details: {e}")
             return None
 
+    def _parse_card_fields(self, teams: List[str], spread_pct: List[str], total_pct: List[str]) -> Optional[Dict]:
+        """
+        Build game data from the text of a matchup card's elements
+
+        Args:
+            teams: Team name texts (away first)
+            spread_pct: Spread betting percentage texts
+            total_pct: Total (over/under) percentage texts
+
+        Returns:
+            Dictionary with team names and betting percentages
+        """
+        game_data = {}
+
+        # Extract team names
+        if len(teams) >= 2:
+            game_data['away_team'] = teams[0].strip()
+            game_data['home_team'] = teams[1].strip()
+
+        # Extract spread betting percentages
+        if len(spread_pct) >= 1:
+            pct_text = spread_pct[0].strip().replace('%', '')
+            try:
+                game_data['spread_bet_pct'] = float(pct_text)
+            except ValueError:
+                pass
+
+        # Extract total (over/under) percentages
+        if len(total_pct) >= 1:
+            pct_text = total_pct[0].strip().replace('%', '')
+            try:
+                game_data['total_bet_pct'] = float(pct_text)
+            except ValueError:
+                pass
+
+        return game_data if len(game_data) > 2 else None
+
     def _parse_matchup_row(self, row) -> Optional[Dict]:
         """
         Alternative parser for different page structure
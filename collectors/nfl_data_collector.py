@@ -4,37 +4,167 @@ Fetches odds, betting percentages, and matchup stats for all NFL games
 """
 
 import json
+import logging
+import os
+import queue
 import time
 import re
+import shelve
+import threading
+import lxml.etree
+import lxml.html
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib json module
+    orjson = None
+
+from config.settings import CACHE_DIR
+from .concurrency import AIMDController, TokenBucket
 from .odds_api import OddsAPI
 
+logger = logging.getLogger(__name__)
+
+# Runs of characters not allowed in a URL slug
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+# Separator between the two teams of a scraped matchup ("A @ B", "A vs. B", "A at B")
+_MATCHUP_SPLIT_RE = re.compile(r'\s*@\s*|\s+(?:at|vs\.?|v\.?)\s+', re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def _selector_xpath(selectors: str) -> lxml.etree.XPath:
+    """
+    Compile a comma-separated group of '.class' / '[attr]' CSS selectors
+    
+    Args:
+        selectors: Selector group, e.g. '.matchup, [data-game]'
+    
+    Returns:
+        XPath matching descendants that fit any selector, in document order
+    """
+    conditions = []
+    for selector in selectors.split(','):
+        selector = selector.strip()
+        if selector.startswith('.'):
+            conditions.append(f"contains(concat(' ', normalize-space(@class), ' '), ' {selector[1:]} ')")
+        elif selector.startswith('[') and selector.endswith(']'):
+            conditions.append(f"@{selector[1:-1]}")
+        else:
+            raise ValueError(f"Unsupported selector: {selector}")
+    return lxml.etree.XPath(f".//*[{' or '.join(conditions)}]")
+
 
 class NFLDataCollector:
     """Main class for collecting NFL betting data"""
     
-    def __init__(self, odds_api_key: str, nfl_week: int = None):
+    # Serializes every stat table on a TeamRankings matchup page: the title
+    # from the nearest preceding h2/h3 sibling (the earlier of the two, as
+    # the XPath './preceding-sibling::h2[1] | ./preceding-sibling::h3[1]'
+    # would pick), whether it has a thead, and the text of each tbody row's cells
+    _TABLES_SCRIPT = """
+        const tables = document.querySelectorAll('table.tr-table, table[class*="stat"], table');
+        return Array.from(tables, table => {
+            let h2 = null, h3 = null;
+            for (let el = table.previousElementSibling; el && !(h2 && h3); el = el.previousElementSibling) {
+                if (!h2 && el.tagName === 'H2') h2 = el;
+                if (!h3 && el.tagName === 'H3') h3 = el;
+            }
+            const header = (h2 && h3)
+                ? (h2.compareDocumentPosition(h3) & Node.DOCUMENT_POSITION_FOLLOWING ? h2 : h3)
+                : (h2 || h3);
+            const tbody = table.querySelector('tbody');
+            return {
+                title: header ? header.innerText.trim() : null,
+                has_thead: table.querySelector('thead') !== null,
+                rows: tbody ? Array.from(tbody.querySelectorAll('tr'),
+                    tr => Array.from(tr.querySelectorAll('td'), td => td.innerText.trim())) : []
+            };
+        });
+    """
+    
+    # TeamRankings matchup URL patterns, in the order tried when none has worked yet
+    MATCHUP_URL_PATTERNS = (
+        "https://www.teamrankings.com/nfl/matchup/{away}-{home}-week-{week}-2025/stats",
+        "https://www.teamrankings.com/nfl/matchup/{away}-at-{home}-week-{week}-2025/stats",
+        "https://www.teamrankings.com/nfl/matchup/{home}-{away}-week-{week}-2025/stats",
+        "https://www.teamrankings.com/nfl/matchup/{home}-at-{away}-week-{week}-2025/stats",
+    )
+    
+    # Matchup pages started per second, shared by all scraping workers
+    SCRAPE_RATE = 2.0
+    
+    # SportsBettingDime public betting page and its per-game elements
+    BETTING_TRENDS_URL = 'https://www.sportsbettingdime.com/nfl/public-betting-trends/'
+    BETTING_GAME_SELECTOR = '.game-card, .betting-trends-row, [data-game], .public-betting-game'
+    
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    
+    def __init__(self, odds_api_key: str, nfl_week: int = None,
+                 matchup_cache: str = f'{CACHE_DIR}/matchup_cache.db', matchup_cache_ttl_hours: float = 24):
         """
         Initialize the collector
         
         Args:
             odds_api_key: API key from The Odds API
             nfl_week: NFL week number (auto-detects if None)
+            matchup_cache: shelve file for scraped matchup stats
+            matchup_cache_ttl_hours: Hours cached matchup stats are reused for (0 disables caching)
         """
         self.odds_api = OddsAPI(odds_api_key)
         self.nfl_week = nfl_week or self._detect_nfl_week()
         self.driver = None
         
+        # Extra browsers for parallel matchup scraping (besides self.driver)
+        self._driver_pool: List[webdriver.Chrome] = []
+        
+        # TeamRankings uses one URL pattern all season, so the last one that
+        # worked is tried first for the next game
+        self._matchup_url_pattern: Optional[str] = None
+        
+        # Matchup stats by (week, away, home), so re-runs skip unchanged pages
+        self._matchup_cache = matchup_cache
+        self._matchup_cache_ttl = matchup_cache_ttl_hours * 3600
+        
+        # Adapts how many matchup pages are fetched at once (set per scrape)
+        self._fetch_limiter: Optional[AIMDController] = None
+        
+        # Pooled HTTP connections shared by all scrape workers, with rate
+        # limited (429) and transient errors retried with backoff
+        self._session = requests.Session()
+        self._session.headers['User-Agent'] = self.USER_AGENT
+        self._session.mount('https://', HTTPAdapter(
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=1,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True
+            )
+        ))
+        
+        # Held while self.driver is in use, since betting percentages and
+        # matchup stats are scraped at the same time
+        self._driver_lock = threading.Lock()
+        
+        # Games keyed by Odds API id; saved as data['games'] (see games_list)
+        self._games: Dict[str, Dict] = {}
+        
         self.data = {
             'week': self.nfl_week,
-            'games': [],
             'last_updated': None,
             'data_sources': {
                 'odds': 'The Odds API',
@@ -78,6 +208,19 @@ class NFLDataCollector:
             'Tennessee Titans': 'titans',
             'Washington Commanders': 'commanders'
         }
+        
+        # Casefolded full names and single words for get_team_slug. Built
+        # from all 32 teams, so shared words ('new', 'los', 'bay', ...) never
+        # match, whichever teams play this week
+        self._team_slug_index = self._build_name_index(self.team_slug_map)
+        
+        # Team slug -> game id, rebuilt in fetch_odds for _add_betting_data
+        self._game_by_slug: Dict[str, str] = {}
+    
+    @property
+    def games_list(self) -> List[Dict]:
+        """Collected games in the order the Odds API returned them"""
+        return list(self._games.values())
     
     def _detect_nfl_week(self) -> int:
         """Auto-detect current NFL week based on season start"""
@@ -87,6 +230,15 @@ class NFLDataCollector:
     
     def initialize_driver(self):
         """Initialize Selenium WebDriver"""
+        self.driver = self._create_driver()
+
+    def _create_driver(self) -> webdriver.Chrome:
+        """
+        Launch a configured headless Chrome instance
+
+        Returns:
+            New WebDriver (used for the main driver and the matchup pool)
+        """
         print("Initializing browser...")
 
         options = webdriver.ChromeOptions()
@@ -97,15 +249,26 @@ class NFLDataCollector:
         options.add_argument('--disable-web-security')
         options.add_argument('--allow-running-insecure-content')
         options.add_argument('--window-size=1920,1080')
-        options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        options.add_argument(f'user-agent={self.USER_AGENT}')
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
 
+        # Only page text is read, so skip downloading images and stylesheets,
+        # and let get() return at DOMContentLoaded - explicit waits cover
+        # later content
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.stylesheets': 2,
+            'profile.default_content_setting_values.notifications': 2,
+        })
+        options.page_load_strategy = 'eager'
+
         try:
-            self.driver = webdriver.Chrome(options=options)
+            driver = webdriver.Chrome(options=options)
 
             # Hide webdriver property to avoid detection
-            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+            driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
                 'source': '''
                     Object.defineProperty(navigator, 'webdriver', {
                         get: () => undefined
@@ -114,6 +277,7 @@ class NFLDataCollector:
             })
 
             print("✓ Browser initialized")
+            return driver
         except Exception as e:
             print(f"Error initializing browser: {e}")
             print("Trying with webdriver-manager...")
@@ -127,8 +291,9 @@ class NFLDataCollector:
                     raise Exception("ChromeDriverManager returned None - driver installation failed")
 
                 service = Service(driver_path)
-                self.driver = webdriver.Chrome(service=service, options=options)
+                driver = webdriver.Chrome(service=service, options=options)
                 print("✓ Browser initialized with webdriver-manager")
+                return driver
             except Exception as webdriver_error:
                 print(f"❌ Failed to initialize Chrome driver: {webdriver_error}")
                 print("\nPlease ensure Chrome/Chromium is installed:")
@@ -136,20 +301,65 @@ class NFLDataCollector:
                 print("  or download ChromeDriver from: https://chromedriver.chromium.org/")
                 raise
     
+    @staticmethod
+    def _build_name_index(names: Dict[str, str]) -> Dict[str, str]:
+        """
+        Index values by casefolded team name and by each word of it
+        
+        Words shared by names with different values ('new', 'york', 'los',
+        'bay', ...) are left out, so a single word is never ambiguous.
+        
+        Args:
+            names: Full team name -> value (slug, game id, ...)
+        
+        Returns:
+            Casefolded name or word -> value
+        """
+        index = {}
+        ambiguous = set()
+        for name, value in names.items():
+            for word in _SLUG_RE.split(name.casefold()):
+                if word and index.setdefault(word, value) != value:
+                    ambiguous.add(word)
+        
+        for word in ambiguous:
+            del index[word]
+        
+        index.update((name.casefold(), value) for name, value in names.items())
+        return index
+    
+    @staticmethod
+    def _lookup_name(index: Dict[str, str], name: str) -> Optional[str]:
+        """
+        Find a name in a _build_name_index index
+        
+        Args:
+            index: Casefolded name or word -> value
+            name: Full or partial team name
+        
+        Returns:
+            Value for the full name, else for its first indexed word, else None
+        """
+        name_key = name.strip().casefold()
+        if name_key in index:
+            return index[name_key]
+        
+        for word in _SLUG_RE.split(name_key):
+            if word in index:
+                return index[word]
+        
+        return None
+    
     def get_team_slug(self, team_name: str) -> str:
         """Convert team name to TeamRankings URL slug"""
-        # Direct mapping
-        if team_name in self.team_slug_map:
-            return self.team_slug_map[team_name]
-        
-        # Fuzzy match
-        for full_name, slug in self.team_slug_map.items():
-            if team_name.lower() in full_name.lower() or full_name.lower() in team_name.lower():
-                return slug
+        # Full name, or the first word that identifies a single team
+        slug = self._lookup_name(self._team_slug_index, team_name)
+        if slug:
+            return slug
         
         # Fallback: convert to slug format
-        slug = team_name.lower()
-        slug = re.sub(r'[^a-z0-9]+', '-', slug)
+        slug = team_name.casefold()
+        slug = _SLUG_RE.sub('-', slug)
         slug = slug.strip('-')
         return slug
     
@@ -165,18 +375,32 @@ class NFLDataCollector:
         
         print(f"✓ Found {len(games_data)} games")
         
-        # Process each game
+        # Process each game - OddsAPI already flattened the first
+        # bookmaker's lines while computing implied probabilities
         for game in games_data:
+            odds = game.get('processed_odds')
+            if odds is None:
+                odds = self._process_odds(game.get('bookmakers', []))
+            
             game_info = {
                 'id': game['id'],
                 'home_team': game['home_team'],
                 'away_team': game['away_team'],
                 'commence_time': game['commence_time'],
-                'odds': self._process_odds(game.get('bookmakers', [])),
+                'odds': odds,
                 'betting_percentages': {},
                 'matchup_stats': {}
             }
-            self.data['games'].append(game_info)
+            self._games[game_info['id']] = game_info
+        
+        # Both teams -> game id, keyed by slug so scraped names resolve
+        # through the all-teams index
+        self._game_by_slug = {}
+        for game_id, game in self._games.items():
+            for team in (game['away_team'], game['home_team']):
+                slug = self._lookup_name(self._team_slug_index, team)
+                if slug:
+                    self._game_by_slug[slug] = game_id
         
         return True
     
@@ -221,206 +445,450 @@ class NFLDataCollector:
         """Scrape public betting percentages"""
         print("\n💰 Scraping betting percentages...")
         
-        if not self.driver:
-            self.initialize_driver()
+        # The trends page is usually server-rendered, so a plain HTTP fetch
+        # avoids a browser page load; Chrome is only used if it has no games
+        game_elements = self._fetch_betting_rows_static() or self._fetch_betting_rows_browser()
+        
+        if not game_elements:
+            print("⚠️  No betting data elements found")
+            return
+        
+        print(f"✓ Found {len(game_elements)} games with betting data")
+        
+        for game_el in game_elements:
+            try:
+                matchup = self._extract_text(game_el, 
+                    '.matchup, .teams, .game-matchup, .team-names')
+                
+                bet_pct = self._extract_text(game_el, 
+                    '.spread-bet-pct, [data-spread-bet], .bet-percentage')
+                money_pct = self._extract_text(game_el, 
+                    '.spread-money-pct, [data-spread-money], .money-percentage')
+                
+                self._add_betting_data(matchup, {
+                    'spread_bet_pct': bet_pct,
+                    'spread_money_pct': money_pct,
+                    'source': 'SportsBettingDime'
+                })
+            except Exception as e:
+                continue
+    
+    def _fetch_betting_rows_static(self) -> List:
+        """
+        Fetch the betting trends page over HTTP and find its game elements
         
+        Returns:
+            Parsed lxml game elements, or empty list if the page could not be
+            fetched or has no server-rendered games
+        """
         try:
-            self.driver.get('https://www.sportsbettingdime.com/nfl/public-betting-trends/')
-            time.sleep(5)
+            response = self._session.get(self.BETTING_TRENDS_URL, timeout=15)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"⚠️  Could not fetch betting trends page: {e}")
+            return []
+        
+        try:
+            tree = lxml.html.fromstring(response.content)
+        except (lxml.etree.ParserError, ValueError) as e:
+            # e.g. an empty body - let the browser fallback have a try
+            print(f"⚠️  Could not parse betting trends page: {e}")
+            return []
+        return _selector_xpath(self.BETTING_GAME_SELECTOR)(tree)
+    
+    def _fetch_betting_rows_browser(self) -> List:
+        """
+        Load the betting trends page in Chrome and find its game elements
+        
+        Returns:
+            Parsed lxml game elements from the rendered page, or empty list
+        """
+        print("🌐 Loading betting trends in browser...")
+        
+        with self._driver_lock:
+            if not self.driver:
+                self.initialize_driver()
             
             try:
-                game_elements = self.driver.find_elements(By.CSS_SELECTOR, 
-                    '.game-card, .betting-trends-row, [data-game], .public-betting-game')
-                
-                if game_elements:
-                    print(f"✓ Found {len(game_elements)} games with betting data")
-                    
-                    for game_el in game_elements:
-                        try:
-                            matchup = self._extract_text(game_el, 
-                                '.matchup, .teams, .game-matchup, .team-names')
-                            
-                            bet_pct = self._extract_text(game_el, 
-                                '.spread-bet-pct, [data-spread-bet], .bet-percentage')
-                            money_pct = self._extract_text(game_el, 
-                                '.spread-money-pct, [data-spread-money], .money-percentage')
-                            
-                            self._add_betting_data(matchup, {
-                                'spread_bet_pct': bet_pct,
-                                'spread_money_pct': money_pct,
-                                'source': 'SportsBettingDime'
-                            })
-                        except Exception as e:
-                            continue
-                else:
-                    print("⚠️  No betting data elements found")
-                    
+                self.driver.get(self.BETTING_TRENDS_URL)
+            
+                # Wait only until the first game element renders (not a fixed sleep)
+                WebDriverWait(self.driver, 15, poll_frequency=0.2).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, self.BETTING_GAME_SELECTOR)))
             except TimeoutException:
                 print("⚠️  Betting data not available yet")
-                
-        except Exception as e:
-            print(f"❌ Error scraping betting percentages: {e}")
+                return []
+            except Exception as e:
+                print(f"❌ Error scraping betting percentages: {e}")
+                return []
+            
+            # Parse the rendered page in-process rather than issuing
+            # WebDriver commands for every game and field
+            try:
+                tree = lxml.html.fromstring(self.driver.page_source)
+            except (lxml.etree.ParserError, ValueError) as e:
+                print(f"❌ Error scraping betting percentages: {e}")
+                return []
+        return _selector_xpath(self.BETTING_GAME_SELECTOR)(tree)
     
-    def scrape_all_matchup_stats(self):
-        """Auto-scrape matchup stats for ALL games"""
+    def scrape_all_matchup_stats(self, max_workers: int = 4):
+        """
+        Auto-scrape matchup stats for ALL games
+        
+        Games scraped within the matchup cache TTL are reused as is. The
+        rest are first fetched over plain HTTP, since TeamRankings pages are
+        static HTML. Browsers are only started for games whose page had no
+        usable tables. Both passes scrape up to max_workers games at once.
+        
+        Args:
+            max_workers: Number of concurrent games / Chrome instances (default: 4)
+        """
         print(f"\n📈 Scraping matchup stats for Week {self.nfl_week}...")
         
-        if not self.driver:
-            self.initialize_driver()
+        games = self.games_list
+        total_games = len(games)
+        labels = [f"[{idx}/{total_games}]" for idx in range(1, total_games + 1)]
+        
+        # Matchups scraped recently are not fetched again
+        cache_keys = [self._matchup_cache_key(game) for game in games]
+        matchups = self._load_cached_matchups(cache_keys)
+        to_scrape = [idx for idx, matchup_data in enumerate(matchups) if not matchup_data]
+        if len(to_scrape) < total_games:
+            print(f"♻️  Reusing {total_games - len(to_scrape)} cached matchups")
+        
+        workers = max(1, min(max_workers, len(to_scrape)))
+        
+        # Pass 1: plain HTTP + lxml for every game, with the number of
+        # simultaneous page fetches adapted to how TeamRankings responds
+        self._fetch_limiter = AIMDController(c_min=1, c_max=workers, initial=max(1, workers // 2))
+        
+        # Rate limiting: games start at most SCRAPE_RATE per second across
+        # all workers, without idling after games that were already slow
+        rate_limiter = TokenBucket(rate=self.SCRAPE_RATE, capacity=workers)
+        
+        def scrape_static(idx):
+            rate_limiter.acquire()
+            return self._scrape_matchup_static(games[idx], labels[idx])
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = dict(zip(to_scrape, executor.map(scrape_static, to_scrape)))
+        
+        for idx, (matchup_data, _) in results.items():
+            matchups[idx] = matchup_data
+        pending = [idx for idx, (matchup_data, urls) in results.items() if not matchup_data and urls]
+        
+        # Pass 2: browsers for the rest - the main driver plus extras kept
+        # in self._driver_pool, each used by one worker at a time. The main
+        # driver is locked so betting percentages cannot load a page in it
+        if pending:
+            with self._driver_lock:
+                print(f"\n🌐 Loading {len(pending)} matchups in browser...")
+                if not self.driver:
+                    self.initialize_driver()
+                
+                browsers = min(workers, len(pending))
+                while len(self._driver_pool) < browsers - 1:
+                    self._driver_pool.append(self._create_driver())
+                
+                drivers = queue.Queue()
+                for driver in [self.driver] + self._driver_pool[:browsers - 1]:
+                    drivers.put(driver)
+                
+                def scrape_browser(idx):
+                    rate_limiter.acquire()
+                    driver = drivers.get()
+                    try:
+                        return self._scrape_matchup_browser(driver, results[idx][1], labels[idx])
+                    finally:
+                        drivers.put(driver)
+                
+                with ThreadPoolExecutor(max_workers=browsers) as executor:
+                    for idx, matchup_data in zip(pending, executor.map(scrape_browser, pending)):
+                        matchups[idx] = matchup_data
         
+        # Results are written back on this thread, so no locking is needed
         success_count = 0
-        total_games = len(self.data['games'])
+        for game, label, matchup_data in zip(games, labels, matchups):
+            if matchup_data:
+                game['matchup_stats'] = matchup_data
+                success_count += 1
+            else:
+                logger.info("  ⚠️  %s Could not find matchup data for %s @ %s", label, game['away_team'], game['home_team'])
+        
+        self._store_cached_matchups({cache_keys[idx]: matchups[idx] for idx in to_scrape if matchups[idx]})
         
-        for idx, game in enumerate(self.data['games'], 1):
-            print(f"\n[{idx}/{total_games}] {game['away_team']} @ {game['home_team']}")
+        print(f"\n✓ Successfully scraped {success_count}/{total_games} matchups")
+    
+    def _matchup_cache_key(self, game: Dict) -> str:
+        """Matchup cache key for a game, e.g. 5:chiefs:bills"""
+        return f"{self.nfl_week}:{self.get_team_slug(game['away_team'])}:{self.get_team_slug(game['home_team'])}"
+    
+    def _load_cached_matchups(self, cache_keys: List[str]) -> List[Optional[Dict]]:
+        """
+        Look up matchup stats scraped within the cache TTL
+        
+        Args:
+            cache_keys: Keys from _matchup_cache_key, one per game
+        
+        Returns:
+            Cached matchup data (or None) for each key, in the same order
+        """
+        if self._matchup_cache_ttl <= 0:
+            return [None] * len(cache_keys)
+        
+        try:
+            with shelve.open(self._matchup_cache, flag='r') as cache:
+                entries = [cache.get(key) for key in cache_keys]
+        except Exception:
+            # No cache yet (or an unreadable one) - scrape everything
+            return [None] * len(cache_keys)
+        
+        now = time.time()
+        return [entry['matchup_stats'] if entry and now - entry['scraped_at'] < self._matchup_cache_ttl else None
+                for entry in entries]
+    
+    def _store_cached_matchups(self, matchups: Dict[str, Dict]):
+        """Save freshly scraped matchup stats by cache key"""
+        if self._matchup_cache_ttl <= 0 or not matchups:
+            return
+        
+        try:
+            Path(self._matchup_cache).parent.mkdir(parents=True, exist_ok=True)
+            with shelve.open(self._matchup_cache) as cache:
+                scraped_at = time.time()
+                for key, matchup_data in matchups.items():
+                    cache[key] = {'scraped_at': scraped_at, 'matchup_stats': matchup_data}
+        except Exception as e:
+            logger.warning("⚠️  Could not save matchup cache: %s", e)
+    
+    def _scrape_matchup_static(self, game: Dict, label: str) -> Tuple[Optional[Dict], List[str]]:
+        """
+        Scrape matchup stats for one game over plain HTTP
+        
+        Args:
+            game: Game dictionary (read only)
+            label: Progress label for log lines, e.g. "[3/16]"
+        
+        Returns:
+            Tuple of (matchup data or None, URLs worth retrying in a browser)
+        """
+        logger.debug("%s %s @ %s", label, game['away_team'], game['home_team'])
 
-            away_slug = self.get_team_slug(game['away_team'])
-            home_slug = self.get_team_slug(game['home_team'])
-            print(f"  Slugs: {away_slug} @ {home_slug}")
+        away_slug = self.get_team_slug(game['away_team'])
+        home_slug = self.get_team_slug(game['home_team'])
+        logger.debug("  Slugs: %s @ %s", away_slug, home_slug)
 
-            # Try multiple URL patterns
-            urls_to_try = [
-                f"https://www.teamrankings.com/nfl/matchup/{away_slug}-{home_slug}-week-{self.nfl_week}-2025/stats",
-                f"https://www.teamrankings.com/nfl/matchup/{away_slug}-at-{home_slug}-week-{self.nfl_week}-2025/stats",
-                f"https://www.teamrankings.com/nfl/matchup/{home_slug}-{away_slug}-week-{self.nfl_week}-2025/stats",
-                f"https://www.teamrankings.com/nfl/matchup/{home_slug}-at-{away_slug}-week-{self.nfl_week}-2025/stats",
-            ]
+        # Try multiple URL patterns, the one that worked last time first
+        patterns = sorted(self.MATCHUP_URL_PATTERNS, key=lambda pattern: pattern != self._matchup_url_pattern)
+        urls_to_try = []
 
-            matchup_data = None
+        for pattern in patterns:
+            url = pattern.format(away=away_slug, home=home_slug, week=self.nfl_week)
 
-            for url in urls_to_try:
-                try:
-                    print(f"  Trying: {url}")
-                    self.driver.get(url)
-                    time.sleep(3)
+            logger.debug("  Fetching: %s", url)
+            tables, page_missing = self._fetch_matchup_tables(url)
 
-                    # Debug: show page title
-                    page_title = self.driver.title
-                    print(f"    Page title: {page_title}")
+            # A pattern the server reports missing is not worth a browser load
+            if page_missing:
+                continue
 
-                    # Check for 404
-                    if "Page Not Found" in page_title or "404" in page_title or "Not Found" in self.driver.page_source[:500]:
-                        print(f"    ⚠️  404 - Page not found")
-                        continue
+            matchup_data = self._build_matchup_data(url, tables) if tables else None
+            if matchup_data:
+                self._matchup_url_pattern = pattern
+                logger.info("  ✓ %s %s @ %s: collected %d stat tables", label, game['away_team'],
+                            game['home_team'], len(matchup_data['offense_vs_defense']))
+                return matchup_data, []
 
-                    # Look for tables with multiple selectors
-                    wait = WebDriverWait(self.driver, 10)
-                    try:
-                        tables = wait.until(EC.presence_of_all_elements_located(
-                            (By.CSS_SELECTOR, 'table.tr-table, table[class*="stat"], table')))
-                    except TimeoutException:
-                        print(f"    ⚠️  Timeout - No tables found")
-                        continue
-
-                    if not tables:
-                        print(f"    ⚠️  No tables on page")
-                        continue
-
-                    print(f"    Found {len(tables)} tables, processing...")
-
-                    matchup_data = {
-                        'url': url,
-                        'offense_vs_defense': {},
-                        'scraped_at': datetime.now().isoformat()
-                    }
+            urls_to_try.append(url)
 
-                    for table_idx, table in enumerate(tables):
-                        try:
-                            section_title = f"Table {table_idx + 1}"
-                            try:
-                                header = table.find_element(By.XPATH,
-                                    './preceding-sibling::h2[1] | ./preceding-sibling::h3[1]')
-                                section_title = header.text.strip()
-                            except:
-                                pass
-
-                            # Check if table has thead and tbody
-                            try:
-                                thead = table.find_element(By.TAG_NAME, 'thead')
-                                headers = [th.text.strip() for th in thead.find_elements(By.TAG_NAME, 'th')]
-                            except:
-                                # Skip tables without proper headers
-                                continue
-
-                            try:
-                                tbody = table.find_element(By.TAG_NAME, 'tbody')
-                                rows = tbody.find_elements(By.TAG_NAME, 'tr')
-                            except:
-                                # Skip tables without tbody
-                                continue
-
-                            if not rows:
-                                continue
-
-                            table_data = []
-                            for row in rows:
-                                try:
-                                    cells = row.find_elements(By.TAG_NAME, 'td')
-                                    if len(cells) >= 3:
-                                        row_data = {
-                                            'stat': cells[0].text.strip(),
-                                            'away': cells[1].text.strip(),
-                                            'home': cells[2].text.strip()
-                                        }
-                                        table_data.append(row_data)
-                                except Exception as row_error:
-                                    # Skip problematic rows
-                                    continue
-
-                            if table_data:
-                                matchup_data['offense_vs_defense'][section_title] = table_data
-
-                        except Exception as e:
-                            print(f"    ⚠️  Error processing table {table_idx}: {e}")
-                            continue
-
-                    if matchup_data['offense_vs_defense']:
-                        game['matchup_stats'] = matchup_data
-                        success_count += 1
-                        print(f"  ✓ Success! Collected {len(matchup_data['offense_vs_defense'])} stat tables")
-                        break
-                    else:
-                        print(f"    ⚠️  No data extracted from tables")
-
-                except Exception as e:
-                    print(f"    ❌ Error: {e}")
-                    continue
-            
-            if not matchup_data or not matchup_data.get('offense_vs_defense'):
-                print(f"  ⚠️  Could not find matchup data")
-            
-            time.sleep(2)  # Rate limiting
+        if not urls_to_try:
+            logger.debug("  ⚠️  %s No matchup page exists for any URL pattern", label)
+            return None, []
+
+        logger.debug("    ⚠️  %s No tables in page HTML, will retry in browser", label)
+        return None, urls_to_try
+
+    def _fetch_matchup_tables(self, url: str) -> Tuple[Optional[List[Dict]], bool]:
+        """
+        Fetch a matchup page over HTTP and parse its tables with lxml
         
-        print(f"\n✓ Successfully scraped {success_count}/{total_games} matchups")
-    
-    def _extract_text(self, element, selectors: str) -> str:
-        """Extract text from element using multiple selectors"""
+        Args:
+            url: TeamRankings matchup URL
+        
+        Returns:
+            Tuple of (tables in the same shape _TABLES_SCRIPT returns, or
+            None if the page could not be fetched; True if the server
+            reported the page missing (404/410))
+        """
+        limiter = self._fetch_limiter
+        if limiter:
+            limiter.acquire()
+        start = time.monotonic()
+        status = None
+        try:
+            response = self._session.get(url, timeout=10)
+            status = response.status_code
+        except requests.RequestException as e:
+            logger.debug("    ❌ Error: %s", e)
+            return None, False
+        finally:
+            if limiter:
+                limiter.release(time.monotonic() - start, status)
+
+        if response.status_code != 200:
+            logger.debug("    ⚠️  HTTP %s", response.status_code)
+            return None, response.status_code in (404, 410)
+
         try:
-            for selector in selectors.split(','):
+            tree = lxml.html.fromstring(response.content)
+        except (lxml.etree.ParserError, ValueError) as e:
+            # e.g. an empty 200 body - leave the page to the browser pass
+            logger.debug("    ⚠️  Unparseable page: %s", e)
+            return None, False
+
+        tables = []
+        for table in tree.iter('table'):
+            # Nearest preceding h2/h3 sibling, whichever comes first in the document
+            header = table.xpath('./preceding-sibling::h2[1] | ./preceding-sibling::h3[1]')
+
+            # Browsers wrap bare rows in an implicit tbody; lxml does not
+            tbody = table.find('.//tbody')
+            if tbody is not None:
+                rows = tbody.iter('tr')
+            else:
+                rows = table.xpath('.//tr[not(ancestor::thead) and not(ancestor::tfoot)]')
+
+            tables.append({
+                'title': header[0].text_content().strip() if header else None,
+                'has_thead': table.find('.//thead') is not None,
+                'rows': [[td.text_content().strip() for td in tr.iter('td')] for tr in rows]
+            })
+
+        return tables, False
+
+    def _scrape_matchup_browser(self, driver: webdriver.Chrome, urls_to_try: List[str], label: str) -> Optional[Dict]:
+        """
+        Load matchup URLs in Chrome until one yields stat tables
+        
+        Args:
+            driver: WebDriver reserved for this call
+            urls_to_try: Candidate TeamRankings matchup URLs
+            label: Progress label for log lines, e.g. "[3/16]"
+        
+        Returns:
+            Matchup data, or None if no URL had usable tables
+        """
+        for url in urls_to_try:
+            try:
+                logger.debug("  %s Trying: %s", label, url)
+                # driver.get() returns once the DOM is ready; the table
+                # wait below covers anything rendered after that
+                driver.get(url)
+
+                page_title = driver.title
+                logger.debug("    Page title: %s", page_title)
+
+                # Check for 404 - the title is enough; page_source would
+                # transfer the whole DOM just to look at its first 500 chars
+                if "Not Found" in page_title or "404" in page_title:
+                    logger.debug("    ⚠️  404 - Page not found")
+                    continue
+
+                # Look for tables with multiple selectors
+                wait = WebDriverWait(driver, 10, poll_frequency=0.2)
                 try:
-                    return element.find_element(By.CSS_SELECTOR, selector.strip()).text
-                except:
+                    tables = wait.until(EC.presence_of_all_elements_located(
+                        (By.CSS_SELECTOR, 'table.tr-table, table[class*="stat"], table')))
+                except TimeoutException:
+                    logger.debug("    ⚠️  Timeout - No tables found")
                     continue
-            return "N/A"
-        except:
-            return "N/A"
+
+                if not tables:
+                    logger.debug("    ⚠️  No tables on page")
+                    continue
+
+                logger.debug("    Found %d tables, processing...", len(tables))
+
+                # Read every table in one WebDriver round-trip instead of
+                # one command per header, row and cell
+                matchup_data = self._build_matchup_data(url, driver.execute_script(self._TABLES_SCRIPT))
+                if matchup_data:
+                    logger.info("  ✓ %s %s: collected %d stat tables", label, url,
+                                len(matchup_data['offense_vs_defense']))
+                    return matchup_data
+
+                logger.debug("    ⚠️  No data extracted from tables")
+
+            except Exception as e:
+                logger.debug("    ❌ Error: %s", e)
+                continue
+
+        return None
+
+    def _build_matchup_data(self, url: str, tables: List[Dict]) -> Optional[Dict]:
+        """
+        Convert extracted tables into the game's matchup_stats structure
+        
+        Args:
+            url: Page the tables came from
+            tables: Dicts with 'title', 'has_thead' and 'rows' (cell texts)
+        
+        Returns:
+            Matchup data, or None if no table had usable rows
+        """
+        matchup_data = {
+            'url': url,
+            'offense_vs_defense': {},
+            'scraped_at': datetime.now().isoformat()
+        }
+
+        for table_idx, table in enumerate(tables):
+            # Skip tables without proper headers, tbody or rows
+            if not table['has_thead'] or not table['rows']:
+                continue
+
+            table_data = [
+                {'stat': cells[0], 'away': cells[1], 'home': cells[2]}
+                for cells in table['rows'] if len(cells) >= 3
+            ]
+
+            if table_data:
+                section_title = table['title'] if table['title'] is not None else f"Table {table_idx + 1}"
+                matchup_data['offense_vs_defense'][section_title] = table_data
+
+        return matchup_data if matchup_data['offense_vs_defense'] else None
+    
+    def _extract_text(self, element, selectors: str) -> str:
+        """Extract text from a parsed element using multiple selectors"""
+        matches = _selector_xpath(selectors)(element)
+        return matches[0].text_content().strip() if matches else "N/A"
     
     def _add_betting_data(self, matchup: str, betting_data: Dict):
         """Add betting data to matching game"""
-        for game in self.data['games']:
-            game_matchup = f"{game['away_team']} @ {game['home_team']}"
-            if (matchup.lower() in game_matchup.lower() or 
-                game['away_team'].lower() in matchup.lower() or
-                game['home_team'].lower() in matchup.lower()):
-                game['betting_percentages'] = betting_data
-                return
-    
-    def collect_all_data(self, include_matchups: bool = True) -> bool:
+        # Either team of "Away @ Home" (or the whole text if it has no
+        # separator) identifies the game; every team that is recognised must
+        # belong to the same game, otherwise the row is skipped
+        game_ids = set()
+        for team in _MATCHUP_SPLIT_RE.split(matchup, maxsplit=1):
+            slug = self._lookup_name(self._team_slug_index, team)
+            if slug:
+                game_ids.add(self._game_by_slug.get(slug))
+        
+        if len(game_ids) == 1 and None not in game_ids:
+            self._games[game_ids.pop()]['betting_percentages'] = betting_data
+    
+    def collect_all_data(self, include_matchups: bool = True, max_workers: int = 4) -> bool:
         """
         Main method to collect all data
         
+        Betting percentages and matchup stats only depend on the odds, so
+        once those are in, both are scraped at the same time. Both are
+        fetched over plain HTTP; Chrome is only started if one of them
+        has to fall back to the browser.
+        
         Args:
             include_matchups: Whether to scrape matchup stats (default: True)
+            max_workers: Number of matchup games scraped at once (default: 4)
         
         Returns:
             True if successful
@@ -434,25 +902,31 @@ class NFLDataCollector:
             print("⚠️  Warning: No odds data available")
             return False
         
-        # Step 2: Scrape betting percentages
-        print("\nSTEP 2: Scraping Betting Percentages")
-        self.scrape_betting_percentages()
-        
-        # Step 3: Scrape matchup stats
-        if include_matchups:
-            print(f"\nSTEP 3: Scraping Matchup Stats for Week {self.nfl_week}")
-            self.scrape_all_matchup_stats()
+        # Steps 2 and 3 write different keys of each game, so they can run
+        # side by side; the browser fallbacks start the main driver on
+        # demand and share it through self._driver_lock
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Step 2: Scrape betting percentages
+            print("\nSTEP 2: Scraping Betting Percentages")
+            betting_done = executor.submit(self.scrape_betting_percentages)
+            
+            # Step 3: Scrape matchup stats
+            if include_matchups:
+                print(f"\nSTEP 3: Scraping Matchup Stats for Week {self.nfl_week}")
+                self.scrape_all_matchup_stats(max_workers=max_workers)
+            
+            betting_done.result()  # Re-raise any scraping error
         
         self.data['last_updated'] = datetime.now().isoformat()
         
         print("\n" + "="*60)
         print("✅ Data collection complete!")
         print(f"   Week: {self.nfl_week}")
-        print(f"   Games: {len(self.data['games'])}")
+        print(f"   Games: {len(self._games)}")
         
-        with_stats = sum(1 for g in self.data['games'] 
+        with_stats = sum(1 for g in self._games.values() 
                         if g['matchup_stats'].get('offense_vs_defense'))
-        print(f"   Games with matchup stats: {with_stats}/{len(self.data['games'])}")
+        print(f"   Games with matchup stats: {with_stats}/{len(self._games)}")
         print("="*60)
         
         return True
@@ -470,24 +944,53 @@ class NFLDataCollector:
         if not filename:
             filename = f'nfl_week_{self.nfl_week}_data.json'
         
-        with open(filename, 'w') as f:
-            json.dump(self.data, f, indent=2)
+        # Same key order as before games were keyed by id: week, games, ...
+        data = {'week': self.nfl_week, 'games': self._games.values(), **self.data}
+        dumps = orjson.dumps if orjson else (lambda obj: json.dumps(obj).encode())
+        
+        # Streamed one game per line, so only a single game's JSON is in
+        # memory at a time rather than one indented string for everything.
+        # Written to a temp file first and renamed into place, so a crash
+        # mid-write never leaves a truncated file for the alert engine
+        tmp_filename = f'{filename}.tmp'
+        with open(tmp_filename, 'wb') as f:
+            f.write(b'{')
+            for key_idx, (key, value) in enumerate(data.items()):
+                f.write(b',\n' if key_idx else b'\n')
+                f.write(dumps(key) + b': ')
+                if key == 'games':
+                    f.write(b'[')
+                    for game_idx, game in enumerate(value):
+                        f.write(b',\n' if game_idx else b'\n')
+                        f.write(dumps(game))
+                    f.write(b'\n]')
+                else:
+                    f.write(dumps(value))
+            f.write(b'\n}\n')
+        os.replace(tmp_filename, filename)
         
         print(f"\n💾 Data saved to {filename}")
         return filename
     
     def close(self):
         """Cleanup resources"""
+        for driver in self._driver_pool:
+            driver.quit()
+        self._driver_pool = []
+        
+        self._session.close()
+        self.odds_api.close()
+        
         if self.driver:
             self.driver.quit()
             print("✓ Browser closed")
 
 
 if __name__ == "__main__":
-    import os
     from dotenv import load_dotenv
     
     load_dotenv()
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     
     API_KEY = os.getenv('ODDS_API_KEY')
     
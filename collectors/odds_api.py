@@ -2,19 +2,54 @@
 The Odds API wrapper - handles all API interactions
 """
 
+import hashlib
+import json
+import time
 import requests
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib json module
+    orjson = None
+
+from config.settings import CACHE_DIR
+
 
 class OddsAPI:
     """Wrapper for The Odds API"""
 
     BASE_URL = "https://api.the-odds-api.com/v4"
 
-    def __init__(self, api_key: str):
+    # Warn once remaining API quota drops to this many requests
+    LOW_QUOTA_WARNING = 50
+
+    def __init__(self, api_key: str, cache_dir: str = f'{CACHE_DIR}/odds'):
         self.api_key = api_key
         self.remaining_requests = None
 
+        # Keep-alive connections, with transient failures retried at the
+        # transport level. Rate-limited (429) responses wait out Retry-After
+        # (or back off exponentially) instead of failing the whole run
+        self._session = requests.Session()
+        self._session.headers.update({'Accept': 'application/json'})
+        self._session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=1,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True
+            )
+        ))
+
+        # Raw API responses, reused within get_nfl_odds' cache_ttl to save quota
+        self._cache_dir = Path(cache_dir)
+
     @staticmethod
     def american_to_implied_prob(odds: int) -> float:
         """
@@ -33,6 +68,27 @@ class OddsAPI:
             # Underdog: 100 / (odds + 100)
             return 100 / (odds + 100) * 100
 
+    @staticmethod
+    def american_to_implied_prob_batch(odds):
+        """
+        Convert many American odds to implied probabilities at once
+
+        Same formula as american_to_implied_prob, applied element-wise
+        with np.where (e.g. every price on a slate or in a backtest).
+
+        Args:
+            odds: Array-like of American odds
+
+        Returns:
+            NumPy array of implied probabilities as percentages (0-100)
+        """
+        # numpy is only needed by callers converting odds in bulk
+        import numpy as np
+
+        odds = np.asarray(odds, dtype=float)
+        abs_odds = np.abs(odds)
+        return np.where(odds < 0, abs_odds / (abs_odds + 100), 100 / (abs_odds + 100)) * 100
+
     @staticmethod
     def calculate_market_probabilities(outcomes: List[Dict]) -> Dict[str, float]:
         """
@@ -52,7 +108,7 @@ class OddsAPI:
         return probs
     
     def get_nfl_odds(self, regions: str = 'us', markets: str = 'h2h,spreads,totals',
-                     include_probabilities: bool = True) -> List[Dict]:
+                     include_probabilities: bool = True, cache_ttl: int = 300) -> List[Dict]:
         """
         Fetch NFL odds from The Odds API with implied probabilities
 
@@ -60,10 +116,22 @@ class OddsAPI:
             regions: Comma-separated regions (default: 'us')
             markets: Comma-separated markets (default: 'h2h,spreads,totals')
             include_probabilities: Calculate implied probabilities from odds
+            cache_ttl: Seconds a cached response is reused for (0 disables caching)
 
         Returns:
             List of games with odds data and implied probabilities
         """
+        cache_file = self._cache_dir / f"{hashlib.md5(f'{regions}|{markets}'.encode()).hexdigest()}.json"
+
+        # Reuse a recent response instead of spending API quota
+        if cache_ttl > 0 and cache_file.exists():
+            age = time.time() - cache_file.stat().st_mtime
+            if age < cache_ttl:
+                print(f"Using cached odds ({age:.0f}s old)")
+                raw = cache_file.read_bytes()
+                games = orjson.loads(raw) if orjson else json.loads(raw)
+                return self._add_implied_probabilities(games) if include_probabilities else games
+
         url = f"{self.BASE_URL}/sports/americanfootball_nfl/odds"
 
         params = {
@@ -74,15 +142,26 @@ class OddsAPI:
         }
 
         try:
-            response = requests.get(url, params=params, timeout=30)
+            response = self._session.get(url, params=params, timeout=30)
             response.raise_for_status()
 
             # Track remaining requests
             self.remaining_requests = response.headers.get('x-requests-remaining')
             if self.remaining_requests:
                 print(f"API requests remaining: {self.remaining_requests}")
+                try:
+                    low_quota = float(self.remaining_requests) <= self.LOW_QUOTA_WARNING
+                except ValueError:
+                    low_quota = False
+                if low_quota:
+                    print(f"⚠️  Odds API quota nearly used up ({self.remaining_requests} requests left)")
 
-            games = response.json()
+            games = orjson.loads(response.content) if orjson else response.json()
+
+            # The body is already JSON, so it is cached as received
+            if cache_ttl > 0:
+                self._cache_dir.mkdir(parents=True, exist_ok=True)
+                cache_file.write_bytes(response.content)
 
             # Add implied probabilities if requested
             if include_probabilities:
@@ -90,7 +169,7 @@ class OddsAPI:
 
             return games
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"Error fetching odds: {e}")
             return []
 
@@ -98,15 +177,32 @@ class OddsAPI:
         """
         Add implied probability calculations to each game's markets
 
+        The first bookmaker's lines are flattened into 'processed_odds' in
+        the same pass, so callers don't walk the bookmakers again.
+
         Args:
             games: List of games from API
 
         Returns:
-            Games with added 'implied_probabilities' for each market
+            Games with added 'implied_probabilities' for each market and
+            'processed_odds' (bookmaker, spreads, totals, moneyline)
         """
         for game in games:
-            for bookmaker in game.get('bookmakers', []):
+            game['processed_odds'] = {}
+
+            for book_idx, bookmaker in enumerate(game.get('bookmakers', [])):
+                processed = None
+                if book_idx == 0:
+                    processed = {
+                        'bookmaker': bookmaker.get('title', 'Unknown'),
+                        'spreads': {},
+                        'totals': {},
+                        'moneyline': {}
+                    }
+                    game['processed_odds'] = processed
+
                 for market in bookmaker.get('markets', []):
+                    market_key = market.get('key')
                     outcomes = market.get('outcomes', [])
                     probs = self.calculate_market_probabilities(outcomes)
 
@@ -116,8 +212,22 @@ class OddsAPI:
                         if outcome_name in probs:
                             outcome['implied_prob'] = round(probs[outcome_name], 1)
 
+                        if processed is None:
+                            continue
+                        if market_key in ('spreads', 'totals'):
+                            processed[market_key][outcome_name] = {
+                                'line': outcome.get('point', 0),
+                                'odds': outcome.get('price', 0)
+                            }
+                        elif market_key == 'h2h':
+                            processed['moneyline'][outcome_name] = outcome.get('price', 0)
+
         return games
     
     def get_requests_remaining(self) -> Optional[int]:
         """Get remaining API requests for this billing period"""
-        return self.remaining_requests
\ No newline at end of file
+        return self.remaining_requests
+
+    def close(self):
+        """Close pooled HTTP connections"""
+        self._session.close()
\ No newline at end of file
@@ -3,25 +3,92 @@ SportsData.IO API wrapper - for betting percentages and trends
 Free tier: 1,000 requests/month
 """
 
+import hashlib
+import json
+import random
+import threading
+import time
 import requests
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib json module
+    orjson = None
+
+from config.settings import CACHE_DIR
+from .concurrency import AIMDController
+
+
+class _JitterRetry(Retry):
+    """Retry whose exponential backoff gets up to 100% random jitter added"""
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        return backoff + random.uniform(0, backoff)
+
 
 class SportsDataAPI:
     """Wrapper for SportsData.IO NFL betting data"""
 
     BASE_URL = "https://api.sportsdata.io/v3/nfl"
 
-    def __init__(self, api_key: str):
+    # Client-side limit, applied even when the API sends no rate-limit headers
+    MAX_REQUESTS_PER_WINDOW = 10
+    RATE_LIMIT_WINDOW = 60  # seconds
+
+    # Pause before the next call once the API reports this many requests left
+    LOW_REMAINING_THRESHOLD = 2
+
+    def __init__(self, api_key: str, cache_dir: str = f'{CACHE_DIR}/sportsdata'):
         self.api_key = api_key
 
-    def get_betting_trends(self, season: int, week: int) -> List[Dict]:
+        # Raw responses, reused within each endpoint's cache_ttl to save quota
+        self._cache_dir = Path(cache_dir)
+
+        # Keep-alive connections, with the API key sent on every request.
+        # Rate limits (429) and server errors are retried with jittered
+        # backoff, waiting out Retry-After when the API sends one, so a
+        # transient failure doesn't fail the whole call. Every retry is
+        # another request against the monthly quota, so a call makes at
+        # most 3 requests
+        self.session = requests.Session()
+        self.session.params = {'key': api_key}
+        self.session.mount('https://api.sportsdata.io', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=_JitterRetry(
+                total=2,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=['GET'],
+                respect_retry_after_header=True
+            )
+        ))
+
+        # Rate-limit state from response headers plus recent request times,
+        # shared by the fetch_week worker threads
+        self._remaining: Optional[int] = None
+        self._reset_at = 0.0
+        self._request_times = deque()
+        self._rate_lock = threading.Lock()
+
+        # How many of those threads may have a request in flight at once
+        self._concurrency = AIMDController(c_min=1, c_max=3, initial=3)
+
+    def get_betting_trends(self, season: int, week: int, cache_ttl: int = 1800) -> List[Dict]:
         """
         Fetch NFL betting trends for a specific week
 
         Args:
             season: NFL season year (e.g., 2025)
             week: Week number (1-18)
+            cache_ttl: Seconds a cached response is reused for (0 disables caching)
 
         Returns:
             List of games with betting trends data including:
@@ -31,86 +98,200 @@ class SportsDataAPI:
         """
         url = f"{self.BASE_URL}/scores/json/BettingTrendsByWeek/{season}/{week}"
 
-        params = {
-            'key': self.api_key
-        }
-
         try:
             print(f"Fetching betting trends for {season} Week {week}...")
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-
-            trends = response.json()
+            trends = self._get_json(url, cache_ttl)
             print(f"✓ Retrieved betting trends for {len(trends)} games")
 
             return trends
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"Error fetching betting trends: {e}")
             return []
 
-    def get_betting_splits(self, season: int, week: int) -> List[Dict]:
+    def get_betting_splits(self, season: int, week: int, cache_ttl: int = 1800) -> List[Dict]:
         """
         Fetch betting splits (public vs sharp money) for a week
 
         Args:
             season: NFL season year
             week: Week number
+            cache_ttl: Seconds a cached response is reused for (0 disables caching)
 
         Returns:
             List of games with betting split data
         """
         url = f"{self.BASE_URL}/scores/json/BettingSplitsByWeek/{season}/{week}"
 
-        params = {
-            'key': self.api_key
-        }
-
         try:
             print(f"Fetching betting splits for {season} Week {week}...")
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-
-            splits = response.json()
+            splits = self._get_json(url, cache_ttl)
             print(f"✓ Retrieved betting splits for {len(splits)} games")
 
             return splits
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"Error fetching betting splits: {e}")
             return []
 
-    def get_game_odds(self, season: int, week: int) -> List[Dict]:
+    def get_game_odds(self, season: int, week: int, cache_ttl: int = 300) -> List[Dict]:
         """
         Fetch current and historical odds for games
 
         Args:
             season: NFL season year
             week: Week number
+            cache_ttl: Seconds a cached response is reused for (odds move
+                faster than trends, so the default is shorter; 0 disables caching)
 
         Returns:
             List of games with odds data from multiple sportsbooks
         """
         url = f"{self.BASE_URL}/odds/json/GameOddsByWeek/{season}/{week}"
 
-        params = {
-            'key': self.api_key
-        }
-
         try:
             print(f"Fetching game odds for {season} Week {week}...")
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-
-            odds = response.json()
+            odds = self._get_json(url, cache_ttl)
             print(f"✓ Retrieved odds for {len(odds)} games")
 
             return odds
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"Error fetching game odds: {e}")
             return []
 
+    def _get_json(self, url: str, cache_ttl: int):
+        """
+        Decoded JSON for a URL, from the on-disk cache when it is fresh enough
+
+        Args:
+            url: Endpoint URL (without the API key)
+            cache_ttl: Seconds a cached response is reused for (0 disables caching)
+
+        Returns:
+            Parsed response body
+
+        Raises:
+            requests.exceptions.RequestException: On network or HTTP errors
+        """
+        cache_file = self._cache_dir / f"{hashlib.md5(url.encode()).hexdigest()}.json"
+
+        # Reuse a recent response instead of spending API quota
+        if cache_ttl > 0 and cache_file.exists():
+            age = time.time() - cache_file.stat().st_mtime
+            if age < cache_ttl:
+                print(f"Using cached response ({age:.0f}s old)")
+                raw = cache_file.read_bytes()
+                return orjson.loads(raw) if orjson else json.loads(raw)
+
+        raw = self._request(url).content
+        data = orjson.loads(raw) if orjson else json.loads(raw)
+
+        # The body is already JSON, so it is cached as received
+        if cache_ttl > 0:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_file.write_bytes(raw)
+
+        return data
+
+    def _request(self, url: str) -> requests.Response:
+        """
+        GET a URL once the rate limits allow, tracking rate-limit headers
+
+        Args:
+            url: Endpoint URL
+
+        Returns:
+            Successful response
+
+        Raises:
+            requests.exceptions.RequestException: On network or HTTP errors
+        """
+        self._wait_for_capacity()
+
+        self._concurrency.acquire()
+        start = time.monotonic()
+        status = None
+        try:
+            response = self.session.get(url, timeout=30)
+            status = response.status_code
+        finally:
+            self._concurrency.release(time.monotonic() - start, status)
+
+        response.raise_for_status()
+
+        self._track_rate_limit(response.headers)
+        return response
+
+    def _wait_for_capacity(self):
+        """Sleep until a request is allowed by the API and the sliding window"""
+        with self._rate_lock:
+            now = time.monotonic()
+            if now < self._reset_at:
+                time.sleep(self._reset_at - now)
+                now = time.monotonic()
+
+            while self._request_times and self._request_times[0] <= now - self.RATE_LIMIT_WINDOW:
+                self._request_times.popleft()
+
+            if len(self._request_times) >= self.MAX_REQUESTS_PER_WINDOW:
+                time.sleep(self._request_times[0] + self.RATE_LIMIT_WINDOW - now)
+                self._request_times.popleft()
+                now = time.monotonic()
+
+            self._request_times.append(now)
+
+    def _track_rate_limit(self, headers):
+        """
+        Record remaining capacity and defer the next call when it runs low
+
+        Args:
+            headers: Response headers
+        """
+        remaining = headers.get('x-requests-remaining', headers.get('x-ratelimit-remaining-requests'))
+        retry_after = headers.get('retry-after')
+
+        try:
+            remaining = int(float(remaining)) if remaining is not None else None
+        except ValueError:
+            remaining = None
+        try:
+            retry_after = float(retry_after) if retry_after is not None else None
+        except ValueError:
+            retry_after = None  # HTTP-date form; fall back to the window
+
+        with self._rate_lock:
+            self._remaining = remaining
+            if remaining is not None and remaining <= self.LOW_REMAINING_THRESHOLD:
+                pause = retry_after if retry_after is not None else self.RATE_LIMIT_WINDOW
+                self._reset_at = time.monotonic() + pause
+                print(f"⚠️  Only {remaining} SportsData.IO requests left, pausing {pause:.0f}s before the next call")
+
+    def fetch_week(self, season: int, week: int) -> Dict[str, List[Dict]]:
+        """
+        Fetch betting trends, splits and odds for a week concurrently
+
+        The three endpoints are independent, so the total wait is the
+        slowest call rather than the sum of all three.
+
+        Args:
+            season: NFL season year
+            week: Week number
+
+        Returns:
+            Dict with 'trends', 'splits' and 'odds' lists (empty on error)
+        """
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            trends = executor.submit(self.get_betting_trends, season, week)
+            splits = executor.submit(self.get_betting_splits, season, week)
+            odds = executor.submit(self.get_game_odds, season, week)
+
+            return {
+                'trends': trends.result(),
+                'splits': splits.result(),
+                'odds': odds.result()
+            }
+
     def detect_reverse_line_movement(self, betting_data: Dict) -> bool:
         """
         Detect if there's reverse line movement (sharp money indicator)
@@ -138,6 +319,10 @@ class SportsDataAPI:
 
         return False
 
+    def close(self):
+        """Close pooled HTTP connections"""
+        self.session.close()
+
 
 if __name__ == "__main__":
     import os
@@ -3,7 +3,8 @@ Configuration settings for NFL Betting Intelligence
 """
 
 import os
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -17,6 +18,7 @@ SPORTSDATA_API_KEY = os.getenv('SPORTSDATA_API_KEY', '')
 # Paths
 BASE_DIR = Path(__file__).parent.parent
 DATA_DIR = os.getenv('DATA_DIR', str(BASE_DIR / 'data'))
+CACHE_DIR = os.getenv('CACHE_DIR', str(BASE_DIR / '.cache'))
 LOGS_DIR = os.getenv('LOGS_DIR', str(BASE_DIR / 'logs'))
 
 # Ensure directories exist
@@ -33,8 +35,12 @@ CHROMEDRIVER_PATH = os.getenv('CHROMEDRIVER_PATH', None)
 # Data storage
 SAVE_HISTORICAL = os.getenv('SAVE_HISTORICAL', 'true').lower() == 'true'
 
+# Hours scraped matchup stats are reused for across runs (0 disables the cache)
+MATCHUP_CACHE_TTL_HOURS = float(os.getenv('MATCHUP_CACHE_TTL_HOURS', '24'))
+
 # NFL Season settings
-NFL_SEASON_START = datetime(2025, 9, 4)  # 2025-26 season start
+# 2025-26 season start; override with NFL_SEASON_START=YYYY-MM-DD for later seasons
+NFL_SEASON_START = datetime.strptime(os.getenv('NFL_SEASON_START', '2025-09-04'), '%Y-%m-%d')
 
 
 def get_current_week() -> int:
@@ -44,12 +50,19 @@ def get_current_week() -> int:
     Returns:
         Current week number (1-18 for regular season)
     """
-    today = datetime.now()
+    return _week_for_date(date.today())
+
+
+@lru_cache(maxsize=8)
+def _week_for_date(today: date) -> int:
+    """Season week for a calendar day (cached, the week only changes daily)"""
+    season_start = NFL_SEASON_START.date()
     
-    if today < NFL_SEASON_START:
+    if today < season_start:
         return 1
     
-    days_since_start = (today - NFL_SEASON_START).days
+    # Whole days, so the time of day never shifts the week boundary
+    days_since_start = (today - season_start).days
     week = (days_since_start // 7) + 1
     
     # Regular season is weeks 1-18
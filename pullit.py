@@ -4,18 +4,176 @@ Fetches: Odds (API) + Betting % (Scraped) + Full Matchup Stats (TeamRankings)
 """
 
 import json
+import os
+import queue
+import random
+import shelve
+import threading
 import time
+import lxml.etree
+import lxml.html
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Dict, List
 import re
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib json module
+    orjson = None
+
+
+# Caches live next to this script, whatever directory it is run from
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+
+# Runs of characters not allowed in a URL slug
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+# Separator between the two teams of a scraped matchup ("A @ B", "A vs. B", "A at B")
+_MATCHUP_SPLIT_RE = re.compile(r'\s*@\s*|\s+(?:at|vs\.?|v\.?)\s+', re.IGNORECASE)
+
+# Serializes every TeamRankings stat table in one WebDriver call: the
+# title of the nearest preceding h2/h3 sibling (the earlier of the two,
+# as the XPath './preceding-sibling::h2[1] | ./preceding-sibling::h3[1]'
+# picks), the thead's th texts and each tbody row's td texts. headers /
+# rows are null when the table has no thead / tbody
+_TABLES_SCRIPT = """
+    return Array.from(document.querySelectorAll('table.tr-table'), table => {
+        let h2 = null, h3 = null;
+        for (let el = table.previousElementSibling; el && !(h2 && h3); el = el.previousElementSibling) {
+            if (!h2 && el.tagName === 'H2') h2 = el;
+            if (!h3 && el.tagName === 'H3') h3 = el;
+        }
+        const header = (h2 && h3)
+            ? (h2.compareDocumentPosition(h3) & Node.DOCUMENT_POSITION_FOLLOWING ? h2 : h3)
+            : (h2 || h3);
+        const thead = table.querySelector('thead');
+        const tbody = table.querySelector('tbody');
+        const texts = (parent, tag) => Array.from(parent.querySelectorAll(tag), el => el.innerText.trim());
+        return {
+            title: header ? header.innerText.trim() : null,
+            headers: thead ? texts(thead, 'th') : null,
+            rows: tbody ? Array.from(tbody.querySelectorAll('tr'), tr => texts(tr, 'td')) : null
+        };
+    });
+"""
+
+
+@lru_cache(maxsize=None)
+def _selector_xpath(selectors: str) -> lxml.etree.XPath:
+    """Compile a comma-separated group of '.class' / '[attr]' CSS selectors to XPath"""
+    conditions = []
+    for selector in selectors.split(','):
+        selector = selector.strip()
+        if selector.startswith('.'):
+            conditions.append(f"contains(concat(' ', normalize-space(@class), ' '), ' {selector[1:]} ')")
+        elif selector.startswith('[') and selector.endswith(']'):
+            conditions.append(f"@{selector[1:-1]}")
+        else:
+            raise ValueError(f"Unsupported selector: {selector}")
+    return lxml.etree.XPath(f".//*[{' or '.join(conditions)}]")
+
+
+@lru_cache(maxsize=8)
+def _week_for_date(season_start: date, today: date) -> int:
+    """NFL week for a calendar day (cached, the week only changes daily)"""
+    if today < season_start:
+        return 1
+    
+    days_since_start = (today - season_start).days
+    week = (days_since_start // 7) + 1
+    
+    # Regular season is weeks 1-18
+    if week > 18:
+        return 18
+    
+    return max(1, week)
+
+
+def _build_name_index(names: Dict[str, object]) -> Dict[str, object]:
+    """
+    Index values by casefolded team name and by each word of it
+
+    Words shared by names with different values ('new', 'york', 'los', ...)
+    are left out, so a single word is never ambiguous.
+    """
+    index = {}
+    ambiguous = set()
+    for name, value in names.items():
+        for word in _SLUG_RE.split(name.casefold()):
+            if word and index.setdefault(word, value) != value:
+                ambiguous.add(word)
+    for word in ambiguous:
+        del index[word]
+    index.update((name.casefold(), value) for name, value in names.items())
+    return index
+
+
+def _lookup_name(index: Dict[str, object], name: str):
+    """Value for a full or partial team name in a _build_name_index index, or None"""
+    name_key = name.strip().casefold()
+    if name_key in index:
+        return index[name_key]
+    for word in _SLUG_RE.split(name_key):
+        if word in index:
+            return index[word]
+    return None
+
+
+class TokenBucket:
+    """Token-bucket rate limiter: waits only for the shortfall, not a fixed delay"""
+    
+    def __init__(self, rate: float, capacity: float = 1):
+        self.rate = rate  # tokens per second
+        self.capacity = capacity  # burst size
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Take a token, sleeping until one is available"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            
+            if self._tokens < 1:
+                time.sleep((1 - self._tokens) / self.rate)
+                self._tokens = 1.0
+                self._updated = time.monotonic()
+            
+            self._tokens -= 1
+
+
+class _JitterRetry(Retry):
+    """Retry whose exponential backoff gets up to 100% random jitter added"""
+    
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        return backoff + random.uniform(0, backoff)
+
+
 class NFLDataCollector:
+    # Warn once remaining Odds API quota drops to this many requests
+    LOW_QUOTA_WARNING = 50
+    
+    # First day of the season, used to auto-detect the NFL week
+    SEASON_START = datetime.strptime(os.getenv('NFL_SEASON_START', '2024-09-05'), '%Y-%m-%d')
+    
+    # Scraped matchup stats by (week, away, home), reused across runs for
+    # MATCHUP_CACHE_TTL_HOURS (0 disables the cache)
+    MATCHUP_CACHE = os.path.join(CACHE_DIR, 'pullit_matchups.db')
+    MATCHUP_CACHE_TTL = float(os.getenv('MATCHUP_CACHE_TTL_HOURS', '24')) * 3600
+    
     def __init__(self, odds_api_key: str, nfl_week: int = None):
         """
         Initialize the collector
@@ -27,6 +185,27 @@ class NFLDataCollector:
         self.odds_api_key = odds_api_key
         self.nfl_week = nfl_week
         self.driver = None
+        
+        # Extra browsers for parallel matchup scraping (besides self.driver)
+        self._driver_pool = []
+        
+        # Matchup page loads: one every 2s on average, bursts of 2
+        self.scrape_limiter = TokenBucket(rate=0.5, capacity=2)
+        
+        # Reused HTTP connection for API calls; rate limits (429) and server
+        # errors are retried with jittered backoff, honoring Retry-After
+        self.http = requests.Session()
+        self.http.mount('https://', HTTPAdapter(max_retries=_JitterRetry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET'],
+            respect_retry_after_header=True
+        )))
+        
+        # Odds API quota left, from the last response's headers
+        self._remaining = None
+        
         self.data = {
             'week': nfl_week,
             'games': [],
@@ -73,57 +252,76 @@ class NFLDataCollector:
             'Tennessee Titans': 'titans',
             'Washington Commanders': 'commanders'
         }
+        
+        # Casefolded full names plus every word that belongs to only one
+        # team ('chiefs', 'green', ...), so partial names need no scan.
+        # Built from all 32 teams, so 'new', 'los', 'bay', ... never match
+        self._slug_index = _build_name_index(self.team_slug_map)
+        
+        # Team slug -> index in data['games'], built in fetch_odds_from_api
+        self._team_to_game = {}
     
     def initialize_driver(self):
         """Initialize Selenium WebDriver"""
+        self.driver = self._create_driver()
+    
+    def initialize_driver_pool(self, n: int = 4):
+        """Start extra browsers so up to n games can be scraped at once"""
+        if not self.driver:
+            self.initialize_driver()
+        
+        while len(self._driver_pool) < n - 1:
+            self._driver_pool.append(self._create_driver())
+    
+    def _create_driver(self) -> webdriver.Chrome:
+        """Launch a configured headless Chrome instance"""
         options = webdriver.ChromeOptions()
         options.add_argument('--headless')
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--disable-blink-features=AutomationControlled')
         options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-        self.driver = webdriver.Chrome(options=options)
+        
+        # Only table text is read, so skip images, stylesheets and notification
+        # prompts (JS stays on for dynamic tables), and let get() return at
+        # DOMContentLoaded - explicit waits cover later content
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.stylesheets': 2,
+            'profile.default_content_setting_values.notifications': 2,
+        })
+        options.page_load_strategy = 'eager'
+        driver = webdriver.Chrome(options=options)
         print("✓ Browser initialized")
+        return driver
     
     def get_team_slug(self, team_name: str) -> str:
         """Convert team name to TeamRankings URL slug"""
-        # Direct mapping
-        if team_name in self.team_slug_map:
-            return self.team_slug_map[team_name]
-        
-        # Fuzzy match - find best match
-        for full_name, slug in self.team_slug_map.items():
-            if team_name.lower() in full_name.lower() or full_name.lower() in team_name.lower():
-                return slug
+        # Direct mapping, or the first word that identifies a single team
+        slug = _lookup_name(self._slug_index, team_name)
+        if slug:
+            return slug
         
         # Fallback: convert to slug format
-        slug = team_name.lower()
-        slug = re.sub(r'[^a-z0-9]+', '-', slug)
-        slug = slug.strip('-')
+        slug = _SLUG_RE.sub('-', team_name.lower()).strip('-')
         return slug
     
     def detect_nfl_week(self) -> int:
         """
         Auto-detect current NFL week based on season start
-        NFL 2024-25 season started Sep 5, 2024
+        NFL 2024-25 season started Sep 5, 2024 (set NFL_SEASON_START=YYYY-MM-DD to change)
         """
-        season_start = datetime(2024, 9, 5)
-        now = datetime.now()
-        
-        if now < season_start:
-            return 1
-        
-        days_since_start = (now - season_start).days
-        week = (days_since_start // 7) + 1
-        
-        # Regular season is weeks 1-18
-        if week > 18:
-            return 18
-        
-        return max(1, week)
+        return _week_for_date(self.SEASON_START.date(), date.today())
     
-    def fetch_odds_from_api(self):
-        """Fetch current NFL odds using The Odds API"""
+    def fetch_odds_from_api(self, cache_ttl: int = 300):
+        """
+        Fetch current NFL odds using The Odds API
+        
+        Args:
+            cache_ttl: Seconds a saved response is reused for instead of
+                spending API quota (0 always fetches)
+        """
         print("📊 Fetching odds from The Odds API...")
         
         url = "https://api.the-odds-api.com/v4/sports/americanfootball_nfl/odds"
@@ -135,16 +333,27 @@ class NFLDataCollector:
         }
         
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
+            cache_file = os.path.join(CACHE_DIR, 'pullit_odds.json')
+            if cache_ttl > 0 and os.path.exists(cache_file) and time.time() - os.path.getmtime(cache_file) < cache_ttl:
+                print("📦 Using cached odds response")
+                with open(cache_file, 'rb') as f:
+                    raw = f.read()
+                games_data = orjson.loads(raw) if orjson else json.loads(raw)
+            else:
+                raw = self._request(url, params).content
+                games_data = orjson.loads(raw) if orjson else json.loads(raw)
+                
+                # The body is already JSON, so it is cached as received
+                if cache_ttl > 0:
+                    os.makedirs(CACHE_DIR, exist_ok=True)
+                    with open(cache_file, 'wb') as f:
+                        f.write(raw)
             
-            games_data = response.json()
             print(f"✓ Found {len(games_data)} games")
             
             # Check remaining quota
-            remaining = response.headers.get('x-requests-remaining')
-            if remaining:
-                print(f"📈 API requests remaining: {remaining}")
+            if self._remaining is not None:
+                print(f"📈 API requests remaining: {self._remaining}")
             
             # Auto-detect week if not provided
             if not self.nfl_week:
@@ -165,12 +374,39 @@ class NFLDataCollector:
                 }
                 self.data['games'].append(game_info)
             
+            # Both teams -> game index, keyed by slug so scraped names
+            # resolve through the all-teams index
+            self._team_to_game = {}
+            for game_idx, game in enumerate(self.data['games']):
+                for team in (game['away_team'], game['home_team']):
+                    slug = _lookup_name(self._slug_index, team)
+                    if slug:
+                        self._team_to_game[slug] = game_idx
+            
             return True
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"❌ Error fetching odds: {e}")
             return False
     
+    def _request(self, url: str, params: Dict) -> requests.Response:
+        """GET a URL and record the remaining API quota from its headers"""
+        response = self.http.get(url, params=params, timeout=30)
+        response.raise_for_status()
+        
+        remaining = response.headers.get('x-requests-remaining',
+                                         response.headers.get('x-ratelimit-remaining-requests'))
+        try:
+            self._remaining = int(float(remaining)) if remaining is not None else None
+        except ValueError:
+            self._remaining = None
+        
+        # The quota is monthly, so waiting would not restore it - just warn
+        if self._remaining is not None and self._remaining <= self.LOW_QUOTA_WARNING:
+            print(f"⚠️  Odds API quota nearly used up ({self._remaining} requests left)")
+        
+        return response
+    
     def _process_odds(self, bookmakers: List) -> Dict:
         """Extract and average odds from multiple bookmakers"""
         if not bookmakers:
@@ -213,17 +449,23 @@ class NFLDataCollector:
         """Scrape public betting percentages from SportsBettingDime"""
         print("\n💰 Scraping betting percentages...")
         
+        # The page is usually server-rendered; only fall back to Chrome
+        # when the plain HTML has no game rows
+        if self._scrape_betting_percentages_static():
+            return
+        
         if not self.driver:
             self.initialize_driver()
         
         try:
             self.driver.get('https://www.sportsbettingdime.com/nfl/public-betting-trends/')
-            time.sleep(5)
             
             try:
-                # Look for game rows
-                game_elements = self.driver.find_elements(By.CSS_SELECTOR, 
-                    '.game-card, .betting-trends-row, [data-game], .public-betting-game')
+                # Look for game rows, waiting only until the first one renders
+                game_selector = '.game-card, .betting-trends-row, [data-game], .public-betting-game'
+                WebDriverWait(self.driver, 10, poll_frequency=0.2).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, game_selector)))
+                game_elements = self.driver.find_elements(By.CSS_SELECTOR, game_selector)
                 
                 if game_elements:
                     print(f"✓ Found {len(game_elements)} games with betting data")
@@ -231,7 +473,8 @@ class NFLDataCollector:
                     for game_el in game_elements:
                         try:
                             matchup = game_el.find_element(By.CSS_SELECTOR, 
-                                '.matchup, .teams, .game-matchup, .team-names').text
+                                '.matchup, .teams, .game-matchup, .team-names'
+                            ).get_attribute('textContent').strip()
                             
                             bet_pct = self._extract_text(game_el, 
                                 '.spread-bet-pct, [data-spread-bet], .bet-percentage')
@@ -254,118 +497,224 @@ class NFLDataCollector:
         except Exception as e:
             print(f"❌ Error scraping betting percentages: {e}")
     
-    def scrape_all_matchup_stats(self):
+    def _scrape_betting_percentages_static(self) -> bool:
+        """Fetch the betting page over HTTP and parse it with lxml; True if any games were found"""
+        try:
+            response = self.http.get('https://www.sportsbettingdime.com/nfl/public-betting-trends/',
+                                     headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'},
+                                     timeout=15)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            print(f"⚠️  Could not fetch betting page: {e}")
+            return False
+        
+        try:
+            tree = lxml.html.fromstring(response.content)
+        except (lxml.etree.ParserError, ValueError) as e:
+            # e.g. an empty body - fall back to the browser
+            print(f"⚠️  Could not parse betting page: {e}")
+            return False
+        game_elements = _selector_xpath('.game-card, .betting-trends-row, [data-game], .public-betting-game')(tree)
+        if not game_elements:
+            return False
+        
+        print(f"✓ Found {len(game_elements)} games with betting data")
+        
+        for game_el in game_elements:
+            texts = []
+            for selectors in ('.matchup, .teams, .game-matchup, .team-names',
+                              '.spread-bet-pct, [data-spread-bet], .bet-percentage',
+                              '.spread-money-pct, [data-spread-money], .money-percentage'):
+                matches = _selector_xpath(selectors)(game_el)
+                texts.append(matches[0].text_content().strip() if matches else "N/A")
+            
+            matchup, bet_pct, money_pct = texts
+            if matchup == "N/A":
+                continue
+            
+            self._add_betting_data(matchup, {
+                'spread_bet_pct': bet_pct,
+                'spread_money_pct': money_pct,
+                'source': 'SportsBettingDime'
+            })
+        
+        return True
+    
+    def scrape_all_matchup_stats(self, max_workers: int = 4):
         """
         Automatically scrape offense vs defense stats for ALL games
+        
+        Args:
+            max_workers: Number of games scraped at once, each in its own browser
         """
         print(f"\n📈 Scraping matchup stats for Week {self.nfl_week}...")
         
-        if not self.driver:
-            self.initialize_driver()
+        games = self.data['games']
+        total_games = len(games)
         
+        # Matchups scraped recently are not loaded again
+        cache_keys = [f"{self.nfl_week}:{self.get_team_slug(game['away_team'])}:{self.get_team_slug(game['home_team'])}"
+                      for game in games]
+        results = [None] * total_games
+        if self.MATCHUP_CACHE_TTL > 0:
+            try:
+                with shelve.open(self.MATCHUP_CACHE, flag='r') as cache:
+                    entries = [cache.get(key) for key in cache_keys]
+                now = time.time()
+                results = [entry['matchup_stats'] if entry and now - entry['scraped_at'] < self.MATCHUP_CACHE_TTL else None
+                           for entry in entries]
+            except Exception:
+                pass  # No cache yet - scrape everything
+        
+        to_scrape = [idx for idx, matchup_data in enumerate(results) if not matchup_data]
+        if len(to_scrape) < total_games:
+            print(f"♻️  Reusing {total_games - len(to_scrape)} cached matchups")
+        
+        workers = max(1, min(max_workers, len(to_scrape)))
+        if to_scrape:
+            self.initialize_driver_pool(workers)
+        
+        # Each worker borrows a browser for one game at a time
+        drivers = queue.Queue()
+        for driver in [self.driver] + self._driver_pool[:workers - 1]:
+            drivers.put(driver)
+        
+        def scrape(idx):
+            # Rate limiting
+            self.scrape_limiter.acquire()
+            driver = drivers.get()
+            try:
+                return self._scrape_one_game(driver, games[idx], f"[{idx + 1}/{total_games}]")
+            finally:
+                drivers.put(driver)
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for idx, matchup_data in zip(to_scrape, executor.map(scrape, to_scrape)):
+                results[idx] = matchup_data
+        
+        fresh = {cache_keys[idx]: results[idx] for idx in to_scrape if results[idx]}
+        if fresh and self.MATCHUP_CACHE_TTL > 0:
+            try:
+                os.makedirs(os.path.dirname(self.MATCHUP_CACHE), exist_ok=True)
+                with shelve.open(self.MATCHUP_CACHE) as cache:
+                    scraped_at = time.time()
+                    for key, matchup_data in fresh.items():
+                        cache[key] = {'scraped_at': scraped_at, 'matchup_stats': matchup_data}
+            except Exception as e:
+                print(f"⚠️  Could not save matchup cache: {e}")
+        
+        # Results are written back on this thread, so no locking is needed
         success_count = 0
-        total_games = len(self.data['games'])
+        for game, matchup_data in zip(games, results):
+            if matchup_data:
+                game['matchup_stats'] = matchup_data
+                success_count += 1
         
-        for idx, game in enumerate(self.data['games'], 1):
-            print(f"\n[{idx}/{total_games}] Processing: {game['away_team']} @ {game['home_team']}")
-            
-            # Get team slugs
-            away_slug = self.get_team_slug(game['away_team'])
-            home_slug = self.get_team_slug(game['home_team'])
-            
-            # Try multiple URL patterns
-            urls_to_try = [
-                f"https://www.teamrankings.com/nfl/matchup/{away_slug}-{home_slug}-week-{self.nfl_week}-2025/stats",
-                f"https://www.teamrankings.com/nfl/matchup/{away_slug}-at-{home_slug}-week-{self.nfl_week}-2025/stats",
-            ]
-            
-            matchup_data = None
-            
-            for url in urls_to_try:
-                try:
-                    print(f"  Trying: {url}")
-                    self.driver.get(url)
-                    time.sleep(2)
-                    
-                    # Check if page loaded successfully
-                    if "Page Not Found" in self.driver.title or "404" in self.driver.page_source:
-                        continue
-                    
-                    # Wait for tables
-                    wait = WebDriverWait(self.driver, 8)
-                    tables = wait.until(EC.presence_of_all_elements_located(
-                        (By.CSS_SELECTOR, 'table.tr-table')))
-                    
-                    if not tables:
+        print(f"\n✓ Successfully scraped {success_count}/{total_games} matchups")
+    
+    def _scrape_one_game(self, driver: webdriver.Chrome, game: Dict, label: str):
+        """
+        Scrape the TeamRankings matchup page for one game
+        
+        Args:
+            driver: Browser reserved for this call
+            game: Game dictionary (read only)
+            label: Progress label, e.g. "[3/16]"
+        
+        Returns:
+            Matchup data, or None if no URL pattern had stat tables
+        """
+        print(f"\n{label} Processing: {game['away_team']} @ {game['home_team']}")
+        
+        # Get team slugs
+        away_slug = self.get_team_slug(game['away_team'])
+        home_slug = self.get_team_slug(game['home_team'])
+        
+        # Try multiple URL patterns
+        urls_to_try = [
+            f"https://www.teamrankings.com/nfl/matchup/{away_slug}-{home_slug}-week-{self.nfl_week}-2025/stats",
+            f"https://www.teamrankings.com/nfl/matchup/{away_slug}-at-{home_slug}-week-{self.nfl_week}-2025/stats",
+        ]
+        
+        # Skip patterns that 404 without paying for a full browser page load
+        urls_to_try = [url for url in urls_to_try if self._probe_url(url)]
+        
+        for url in urls_to_try:
+            try:
+                print(f"  Trying: {url}")
+                driver.get(url)
+                
+                # Check if page loaded successfully
+                if "Page Not Found" in driver.title or "404" in driver.page_source:
+                    continue
+                
+                # Wait for tables
+                wait = WebDriverWait(driver, 8, poll_frequency=0.2)
+                tables = wait.until(EC.presence_of_all_elements_located(
+                    (By.CSS_SELECTOR, 'table.tr-table')))
+                
+                if not tables:
+                    continue
+                
+                matchup_data = {
+                    'url': url,
+                    'offense_vs_defense': {},
+                    'scraped_at': datetime.now().isoformat()
+                }
+                
+                # Read all tables in one WebDriver round-trip instead of
+                # one command per header, row and cell
+                for table_idx, table in enumerate(driver.execute_script(_TABLES_SCRIPT)):
+                    # Skip tables without a thead or tbody
+                    headers = table['headers']
+                    if headers is None or table['rows'] is None:
                         continue
                     
-                    matchup_data = {
-                        'url': url,
-                        'offense_vs_defense': {},
-                        'scraped_at': datetime.now().isoformat()
-                    }
+                    # Section title (if available)
+                    section_title = table['title'] if table['title'] is not None else f"Table {table_idx + 1}"
                     
-                    # Parse all tables
-                    for table_idx, table in enumerate(tables):
-                        try:
-                            # Get section title (if available)
-                            section_title = f"Table {table_idx + 1}"
-                            try:
-                                header = table.find_element(By.XPATH, 
-                                    './preceding-sibling::h2[1] | ./preceding-sibling::h3[1]')
-                                section_title = header.text.strip()
-                            except:
-                                pass
-                            
-                            # Get table headers
-                            thead = table.find_element(By.TAG_NAME, 'thead')
-                            headers = [th.text.strip() for th in thead.find_elements(By.TAG_NAME, 'th')]
-                            
-                            # Get table rows
-                            tbody = table.find_element(By.TAG_NAME, 'tbody')
-                            rows = tbody.find_elements(By.TAG_NAME, 'tr')
-                            
-                            table_data = []
-                            for row in rows:
-                                cells = row.find_elements(By.TAG_NAME, 'td')
-                                if len(cells) >= 3:
-                                    row_data = {
-                                        'stat': cells[0].text.strip(),
-                                        headers[1] if len(headers) > 1 else 'away': cells[1].text.strip(),
-                                        headers[2] if len(headers) > 2 else 'home': cells[2].text.strip()
-                                    }
-                                    table_data.append(row_data)
-                            
-                            if table_data:
-                                matchup_data['offense_vs_defense'][section_title] = table_data
-                        
-                        except Exception as e:
-                            continue
-                    
-                    # If we got data, break the loop
-                    if matchup_data['offense_vs_defense']:
-                        game['matchup_stats'] = matchup_data
-                        success_count += 1
-                        print(f"  ✓ Success! Collected {len(matchup_data['offense_vs_defense'])} stat tables")
-                        break
+                    table_data = []
+                    for cells in table['rows']:
+                        if len(cells) >= 3:
+                            row_data = {
+                                'stat': cells[0],
+                                headers[1] if len(headers) > 1 else 'away': cells[1],
+                                headers[2] if len(headers) > 2 else 'home': cells[2]
+                            }
+                            table_data.append(row_data)
                     
-                except Exception as e:
-                    continue
-            
-            if not matchup_data or not matchup_data.get('offense_vs_defense'):
-                print(f"  ⚠️  Could not find matchup data")
-            
-            # Rate limiting
-            time.sleep(2)
+                    if table_data:
+                        matchup_data['offense_vs_defense'][section_title] = table_data
+                
+                # If we got data, stop trying URLs
+                if matchup_data['offense_vs_defense']:
+                    print(f"  ✓ {label} Success! Collected {len(matchup_data['offense_vs_defense'])} stat tables")
+                    return matchup_data
+                
+            except Exception as e:
+                continue
         
-        print(f"\n✓ Successfully scraped {success_count}/{total_games} matchups")
+        print(f"  ⚠️  {label} Could not find matchup data")
+        return None
+    
+    def _probe_url(self, url: str) -> bool:
+        """Cheap HEAD check before loading a page in Chrome; False only if the page is missing (404/410)"""
+        try:
+            response = self.http.head(url, allow_redirects=True, timeout=5,
+                                      headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'})
+        except requests.exceptions.RequestException:
+            return True  # Let Chrome try anyway
+        return response.status_code not in (404, 410)
     
     def _extract_text(self, element, selectors: str) -> str:
         """Helper to extract text from element"""
+        # textContent is a plain DOM property read, unlike .text, which makes
+        # chromedriver compute what is visible
         try:
             for selector in selectors.split(','):
                 try:
-                    return element.find_element(By.CSS_SELECTOR, selector.strip()).text
+                    found = element.find_element(By.CSS_SELECTOR, selector.strip())
+                    return found.get_attribute('textContent').strip()
                 except:
                     continue
             return "N/A"
@@ -374,14 +723,17 @@ class NFLDataCollector:
     
     def _add_betting_data(self, matchup: str, betting_data: Dict):
         """Add betting percentage data to matching game"""
-        for game in self.data['games']:
-            game_matchup = f"{game['away_team']} @ {game['home_team']}"
-            # Fuzzy matching
-            if (matchup.lower() in game_matchup.lower() or 
-                game['away_team'].lower() in matchup.lower() or
-                game['home_team'].lower() in matchup.lower()):
-                game['betting_percentages'] = betting_data
-                return
+        # Either team of "Away @ Home" / "Away vs Home" (or the whole text)
+        # identifies the game; every team that is recognised must belong to
+        # the same game, otherwise the row is skipped
+        game_idxs = set()
+        for team in _MATCHUP_SPLIT_RE.split(matchup, maxsplit=1):
+            slug = _lookup_name(self._slug_index, team)
+            if slug:
+                game_idxs.add(self._team_to_game.get(slug))
+        
+        if len(game_idxs) == 1 and None not in game_idxs:
+            self.data['games'][game_idxs.pop()]['betting_percentages'] = betting_data
     
     def collect_all_data(self, include_matchups: bool = True):
         """
@@ -393,12 +745,22 @@ class NFLDataCollector:
         print("🏈 Starting NFL Data Collection")
         print("="*60)
         
-        # Step 1: Get odds from API
+        # Step 1: Get odds from API while the browser (needed for matchups in
+        # step 3) starts up. Betting percentages in step 2 are fetched over
+        # HTTP first and only start Chrome themselves if that fails
         print("\nSTEP 1: Fetching Odds Data")
-        if not self.fetch_odds_from_api():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            start_browser = include_matchups and not self.driver
+            driver_ready = executor.submit(self.initialize_driver) if start_browser else None
+            odds_ok = self.fetch_odds_from_api()
+        
+        if not odds_ok:
             print("⚠️  Warning: No odds data available")
             return False
         
+        if driver_ready:
+            driver_ready.result()  # Re-raise any browser startup error
+        
         # Step 2: Scrape betting percentages
         print("\nSTEP 2: Scraping Betting Percentages")
         self.scrape_betting_percentages()
@@ -428,13 +790,39 @@ class NFLDataCollector:
         if not filename:
             filename = f'nfl_week_{self.nfl_week}_data.json'
         
-        with open(filename, 'w') as f:
-            json.dump(self.data, f, indent=2)
+        dumps = orjson.dumps if orjson else (lambda obj: json.dumps(obj).encode())
+        
+        # Streamed one game per line, so only a single game's JSON is in
+        # memory at a time rather than one indented string for everything.
+        # Written to a temp file first and renamed into place, so a crash
+        # mid-write never leaves a truncated file behind
+        tmp_filename = f'{filename}.tmp'
+        with open(tmp_filename, 'wb') as f:
+            f.write(b'{')
+            for key_idx, (key, value) in enumerate(self.data.items()):
+                f.write(b',\n' if key_idx else b'\n')
+                f.write(dumps(key) + b': ')
+                if key == 'games':
+                    f.write(b'[')
+                    for game_idx, game in enumerate(value):
+                        f.write(b',\n' if game_idx else b'\n')
+                        f.write(dumps(game))
+                    f.write(b'\n]')
+                else:
+                    f.write(dumps(value))
+            f.write(b'\n}\n')
+        os.replace(tmp_filename, filename)
         print(f"\n💾 Data saved to {filename}")
         return filename
     
     def close(self):
         """Cleanup"""
+        for driver in self._driver_pool:
+            driver.quit()
+        self._driver_pool = []
+        
+        self.http.close()
+        
         if self.driver:
             self.driver.quit()
             print("✓ Browser closed")
@@ -3,27 +3,45 @@
 Main automation script - Run this daily to collect data and generate alerts
 """
 
+import argparse
+import hashlib
 import os
 import sys
 import json
-from datetime import datetime
+import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
+from typing import List, Optional
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib json module
+    orjson = None
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from collectors.nfl_data_collector import NFLDataCollector
-from analyzers.alert_engine import NFLAlertEngine
+from analyzers.alert_engine import Alert, NFLAlertEngine
 from config.settings import (
     ODDS_API_KEY,
     DATA_DIR,
     SAVE_HISTORICAL,
+    MATCHUP_CACHE_TTL_HOURS,
     get_current_week
 )
 
 
-def main():
-    """Main execution function"""
+def main(use_cache: bool = True):
+    """
+    Main execution function
+    
+    Args:
+        use_cache: Reuse the week's alerts file if it was generated from
+            identical game data (e.g. a cron retry or manual re-run)
+    """
     
     print("=" * 80)
     print("🏈 NFL BETTING INTELLIGENCE - DAILY RUN")
@@ -46,31 +64,44 @@ def main():
     print("STEP 1: Initializing data collector...")
     collector = NFLDataCollector(
         odds_api_key=ODDS_API_KEY,
-        nfl_week=current_week
+        nfl_week=current_week,
+        matchup_cache_ttl_hours=MATCHUP_CACHE_TTL_HOURS
     )
     
     # Collect all data
     print("\nSTEP 2: Collecting data...")
-    success = collector.collect_all_data(include_matchups=True)
+    success = collector.collect_all_data(include_matchups=True, max_workers=4)
     
     if not success:
         print("❌ Data collection failed")
         sys.exit(1)
     
-    # Save data
+    # Save data on a background thread while alerts are generated from the
+    # same data in memory, instead of reading the file back
     print("\nSTEP 3: Saving data...")
-    data_file = collector.save_to_json(
-        filename=f'{DATA_DIR}/weekly/week_{current_week}_data.json'
-    )
-    
-    # Generate alerts
-    print("\nSTEP 4: Generating betting alerts...")
-    alert_engine = NFLAlertEngine(data_file)
-    alerts = alert_engine.analyze_all_games()
-    
-    # Save alerts
-    alerts_file = f'{DATA_DIR}/alerts/week_{current_week}_alerts.json'
-    alert_engine.export_alerts(alerts_file)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        data_saved = executor.submit(
+            collector.save_to_json,
+            filename=f'{DATA_DIR}/weekly/week_{current_week}_data.json'
+        )
+        
+        # Generate alerts, unless this week's alerts came from the same games
+        print("\nSTEP 4: Generating betting alerts...")
+        alerts_file = f'{DATA_DIR}/alerts/week_{current_week}_alerts.json'
+        games = collector.games_list
+        data_hash = _games_hash(games)
+        alerts = _load_cached_alerts(alerts_file, data_hash) if use_cache else None
+        
+        if alerts is not None:
+            print(f"♻️  Game data unchanged, reusing {len(alerts)} alerts from {alerts_file}")
+        else:
+            alert_engine = NFLAlertEngine.from_dict({**collector.data, 'games': games})
+            alerts = alert_engine.analyze_all_games()
+            
+            # Save alerts
+            alert_engine.export_alerts(alerts_file, data_hash=data_hash)
+        
+        data_file = data_saved.result()
     
     # Print summary
     print("\n" + "=" * 80)
@@ -83,12 +114,7 @@ def main():
     # Print alert breakdown
     if alerts:
         print("\n📈 Alert Breakdown:")
-        alert_types = {}
-        for alert in alerts:
-            alert_type = alert['type']
-            alert_types[alert_type] = alert_types.get(alert_type, 0) + 1
-        
-        for alert_type, count in sorted(alert_types.items(), key=lambda x: x[1], reverse=True):
+        for alert_type, count in Counter(alert.type for alert in alerts).most_common():
             print(f"   {alert_type}: {count}")
     
     print("\n" + "=" * 80)
@@ -105,28 +131,68 @@ def main():
     collector.close()
 
 
+def _games_hash(games: List[dict]) -> str:
+    """Fingerprint of the collected games (excludes the run timestamp)"""
+    raw = orjson.dumps(games) if orjson else json.dumps(games).encode()
+    return hashlib.md5(raw).hexdigest()
+
+
+def _load_cached_alerts(alerts_file: str, data_hash: str) -> Optional[List[Alert]]:
+    """
+    Load alerts exported from identical game data
+    
+    Args:
+        alerts_file: Alerts file from a previous run
+        data_hash: _games_hash of the games about to be analyzed
+    
+    Returns:
+        The cached alerts, or None if there are none for this data
+    """
+    try:
+        raw = Path(alerts_file).read_bytes()
+        cached = orjson.loads(raw) if orjson else json.loads(raw)
+        if cached.get('data_hash') != data_hash:
+            return None
+        return [Alert(**alert) for alert in cached['alerts']]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
 def cleanup_old_data():
     """Remove data older than 30 days"""
     print("\n🧹 Cleaning up old data...")
     
-    from datetime import timedelta
-    
-    cutoff_date = datetime.now() - timedelta(days=30)
+    cutoff_ts = (datetime.now() - timedelta(days=30)).timestamp()
     
     for data_type in ['weekly', 'alerts']:
-        data_path = Path(f'{DATA_DIR}/{data_type}')
-        if not data_path.exists():
+        data_path = os.path.join(DATA_DIR, data_type)
+        if not os.path.isdir(data_path):
             continue
         
-        for file in data_path.glob('*.json'):
-            if file.stat().st_mtime < cutoff_date.timestamp():
-                file.unlink()
-                print(f"   Deleted: {file.name}")
+        # scandir entries cache the stat from the directory read
+        deleted = []
+        with os.scandir(data_path) as entries:
+            for entry in entries:
+                if entry.name.endswith('.json') and entry.stat().st_mtime < cutoff_ts:
+                    os.unlink(entry.path)
+                    deleted.append(entry.name)
+        
+        # One summary line per directory rather than a line per file
+        if deleted:
+            print(f"   Deleted {len(deleted)} files from {data_type}/")
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Collect NFL data and generate betting alerts')
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Regenerate alerts even if this week's game data is unchanged")
+    args = parser.parse_args()
+    
+    # Collector progress is logged at INFO; set level=logging.DEBUG for per-URL detail
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
     try:
-        main()
+        main(use_cache=not args.no_cache)
     except KeyboardInterrupt:
         print("\n\n⚠️  Interrupted by user")
         sys.exit(0)